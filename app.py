@@ -2,12 +2,25 @@
 
 import config
 import gradio as gr
-from document_loader import load_documents_from_dir
-from embeddings import get_embed_model
+from document_loader import (
+    compute_docs_manifest,
+    load_docs_manifest,
+    load_documents_from_dir,
+    load_files,
+    save_docs_manifest,
+)
+from embeddings import get_embed_model, is_model_loaded
 from minio_client import get_client, sync_documents
 from rag_chain import chat as rag_chat
-from rag_chain import get_llm, reset_chat_engine
-from vector_store import add_documents, clear_store, get_index
+from rag_chain import get_llm, is_llm_connected, reset_chat_engine
+from vector_store import (
+    add_documents,
+    clear_store,
+    count_documents,
+    delete_by_source,
+    get_index,
+    is_index_created,
+)
 
 
 def preload_models():
@@ -23,6 +36,16 @@ def preload_models():
     print("=" * 50)
 
 
+def model_status() -> str:
+    """현재 로딩된 모델/리소스 상태 표시 (지연 로딩 확인용)."""
+    status = [
+        f"임베딩 모델: {'로딩됨' if is_model_loaded() else '미로딩 (첫 사용 시 로딩)'}",
+        f"LLM 연결: {'연결됨' if is_llm_connected() else '미연결 (첫 사용 시 연결)'}",
+        f"벡터 인덱스: {'생성됨' if is_index_created() else '미생성 (첫 사용 시 생성)'}",
+    ]
+    return "\n".join(status)
+
+
 def initialize_system():
     """Initialize the RAG system by syncing and indexing documents."""
     status_messages = []
@@ -36,31 +59,61 @@ def initialize_system():
         status_messages.append(f"MinIO 동기화 실패: {e}")
         status_messages.append("로컬 docs/ 폴더의 파일을 사용합니다")
 
-    # Load documents (TextNodes)
-    nodes = load_documents_from_dir()
-    if not nodes:
+    # 파일별 내용 해시로 변경분 판단 (증분 인덱싱)
+    current_manifest = compute_docs_manifest()
+    if not current_manifest:
         return "문서를 찾을 수 없습니다. docs/ 폴더에 .md, .csv 또는 .jsonl 파일을 추가하세요."
 
-    status_messages.append(f"{len(nodes)}개 문서 로드 완료")
-
-    # Clear and re-index
-    clear_store()
-    add_documents(nodes)
-    status_messages.append("VectorStoreIndex 인덱싱 완료")
+    previous_manifest = load_docs_manifest()
+    deleted = set(previous_manifest) - set(current_manifest)
+
+    if deleted or not previous_manifest or count_documents() == 0:
+        # 파일 삭제/최초 인덱싱/빈 인덱스 → 전체 재인덱싱
+        nodes = load_documents_from_dir()
+        if not nodes:
+            return "문서를 찾을 수 없습니다. docs/ 폴더에 .md, .csv 또는 .jsonl 파일을 추가하세요."
+
+        status_messages.append(f"{len(nodes)}개 문서 로드 완료")
+        clear_store()
+        add_documents(nodes)
+        status_messages.append("VectorStoreIndex 인덱싱 완료 (전체)")
+    else:
+        changed = [
+            path
+            for path, digest in current_manifest.items()
+            if previous_manifest.get(path) != digest
+        ]
+        if changed:
+            # 변경된 파일만 재로딩 + 기존 노드 교체
+            for path in changed:
+                delete_by_source(path)
+            nodes = load_files(changed)
+            add_documents(nodes)
+            status_messages.append(
+                f"변경된 {len(changed)}개 파일에서 {len(nodes)}개 문서 재인덱싱 완료"
+            )
+        else:
+            status_messages.append("변경된 파일 없음 - 기존 인덱스 유지")
+
+    save_docs_manifest(current_manifest)
 
     return "\n".join(status_messages)
 
 
-def chat(message: str, history: list) -> str:
-    """Process a chat message and return the response."""
+def chat(message: str, history: list):
+    """Process a chat message, streaming the response as it is generated."""
     if not message.strip():
-        return "질문을 입력해주세요."
+        yield "질문을 입력해주세요."
+        return
 
     try:
-        response = rag_chat(message)
-        return response
+        # rag_chat은 delta 단위 제너레이터 - Gradio는 누적 문자열을 기대
+        accumulated = ""
+        for delta in rag_chat(message):
+            accumulated += delta
+            yield accumulated
     except Exception as e:
-        return f"오류가 발생했습니다: {e}"
+        yield f"오류가 발생했습니다: {e}"
 
 
 def reset_conversation():
@@ -78,11 +131,13 @@ def create_app() -> gr.Blocks:
         with gr.Row():
             init_btn = gr.Button("📚 문서 동기화 및 인덱싱", variant="primary")
             reset_btn = gr.Button("🔄 대화 초기화", variant="secondary")
+            status_btn = gr.Button("🩺 모델 상태 확인", variant="secondary")
 
         init_status = gr.Textbox(label="상태", lines=4, interactive=False)
 
         init_btn.click(fn=initialize_system, outputs=init_status)
         reset_btn.click(fn=reset_conversation, outputs=init_status)
+        status_btn.click(fn=model_status, outputs=init_status)
 
         gr.Markdown("---")
 
@@ -101,6 +156,8 @@ def create_app() -> gr.Blocks:
 
 
 if __name__ == "__main__":
-    preload_models()
+    # 기본은 지연 로딩 (첫 질문/인덱싱 시점에 로딩) - CUDA 없는 환경에서도 UI 기동 가능
+    if config.PRELOAD_MODELS:
+        preload_models()
     app = create_app()
     app.launch(server_name="0.0.0.0", server_port=7860)
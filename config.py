@@ -19,11 +19,19 @@ OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "exaone3.5:7.8b")
 
 # Embedding Settings
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "jhgan/ko-sroberta-multitask")
+EMBED_CACHE_DB = os.getenv("EMBED_CACHE_DB", "./embed_cache.db")
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+
+# JSONL Loading Settings (Pydantic 검증은 인덱싱에 불필요 - 디버깅용으로만 켜기)
+VALIDATE_JSONL = os.getenv("VALIDATE_JSONL", "false").lower() == "true"
 
 # Chunking Settings
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "500"))
 CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "50"))
 
+# Startup Settings (기본은 지연 로딩 - 첫 질문/인덱싱 시점에 모델 로딩)
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "false").lower() in ("true", "1")
+
 # Retrieval Settings
 RETRIEVAL_K = int(os.getenv("RETRIEVAL_K", "20"))
 
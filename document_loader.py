@@ -1,14 +1,78 @@
 """LlamaIndex 문서 로딩 - 한국어 RAG 특화."""
 
 import csv
+import functools
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# orjson: C 구현 JSON 파서 (없으면 stdlib json 폴백)
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# pyahocorasick: 키워드 사전 단일 패스 매칭 (없으면 정규식 폴백)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from llama_index.core.schema import TextNode
 
 import config
-from schema import RAGDocument, expand_keywords
+from schema import RAGDocument, canonical_location, expand_keywords
+
+# 모듈 레벨 정규식 사전 컴파일 (행 단위 핫 루프에서 재사용)
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_WS_RE = re.compile(r"\s+")
+_AT_CENTER_RE = re.compile(r"aT\s*센터")
+_CHANGJO_RE = re.compile(r"창조룸\s*([ⅠⅡⅢⅣⅤⅰⅱⅲⅳⅴ])")
+_SEGYERO_RE = re.compile(r"세계로룸\s*([ⅠⅡⅢⅣⅤⅰⅱⅲⅳⅴ])")
+_KOREAN_YM_RE = re.compile(r"(\d{4})년 (\d{1,2})월")
+
+_CATEGORY_PATTERNS = [
+    (re.compile(r"심포지엄|symposium"), "심포지엄"),
+    (re.compile(r"워크숍|workshop"), "워크숍"),
+    (re.compile(r"스쿨|school"), "스쿨"),
+    (re.compile(r"학술대회|conference"), "학술대회"),
+    (re.compile(r"교육|training|리더쉽"), "교육"),
+    (re.compile(r"세미나|seminar"), "세미나"),
+]
+
+_MEDICAL_PATTERNS = [
+    re.compile(r"(천식|COPD|ILD|NTM|폐암|결핵|폐기능|수면|호흡|금연|기침|폐혈관)", re.IGNORECASE),
+    re.compile(r"(기관지확장증|감염병|환경성폐질환|분자폐암)", re.IGNORECASE),
+]
+_EVENT_TYPE_RE = re.compile(r"(심포지엄|워크숍|학술대회|교육|스쿨|세미나)")
+_ORG_RE = re.compile(r"(연구회|학회)")
+_LOCATION_KW_RE = re.compile(r"(양재|aT센터|서울대|중앙대|성모병원|SC)")
+
+# Aho-Corasick용 키워드 사전 (위 정규식 리터럴과 동일)
+_EVENT_KEYWORDS = (
+    "천식", "COPD", "ILD", "NTM", "폐암", "결핵", "폐기능", "수면", "호흡",
+    "금연", "기침", "폐혈관", "기관지확장증", "감염병", "환경성폐질환", "분자폐암",
+    "심포지엄", "워크숍", "학술대회", "교육", "스쿨", "세미나",
+    "연구회", "학회",
+)
+_LOCATION_KEYWORDS = ("양재", "aT센터", "서울대", "중앙대", "성모병원", "SC")
+
+
+def _build_automaton(keywords: tuple[str, ...]):
+    """소문자 키로 매칭하고 원형 키워드를 돌려주는 automaton 생성."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+if ahocorasick is not None:
+    _EVENT_AUTOMATON = _build_automaton(_EVENT_KEYWORDS)
+    _LOCATION_AUTOMATON = _build_automaton(_LOCATION_KEYWORDS)
 
 
 def convert_date_to_korean(text: str) -> str:
@@ -18,27 +82,44 @@ def convert_date_to_korean(text: str) -> str:
         year, month, day = match.groups()
         return f"{year}년 {int(month)}월 {int(day)}일"
 
-    return re.sub(r"(\d{4})-(\d{2})-(\d{2})", replace_date, text)
+    return _DATE_RE.sub(replace_date, text)
 
 
-def extract_date_metadata(date_str: str) -> dict:
-    """Extract year, month, day, date_int, and weekday info from YYYY-MM-DD date string."""
-    from datetime import datetime as dt
+def _parse_ymd(date_str: str) -> tuple[int, int, int] | None:
+    """Parse YYYY-MM-DD into (year, month, day) via slicing (regex fallback).
+
+    CSV 날짜 포맷은 상위에서 고정되어 있어 슬라이싱이 정규식보다 수십 배 빠름.
+    """
+    if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+        except ValueError:
+            pass
 
-    match = re.match(r"(\d{4})-(\d{2})-(\d{2})", date_str)
+    match = _DATE_RE.match(date_str)
     if match:
         year, month, day = match.groups()
+        return int(year), int(month), int(day)
+    return None
+
+
+def extract_date_metadata(date_str: str) -> dict:
+    """Extract year, month, day, date_int, and weekday info from YYYY-MM-DD date string."""
+    from datetime import date
+
+    parsed = _parse_ymd(date_str)
+    if parsed:
+        year, month, day = parsed
         # YYYYMMDD 정수형 (정밀한 날짜 비교용)
-        date_int = int(f"{year}{month}{day}")
+        date_int = year * 10000 + month * 100 + day
 
         # 요일 계산 (0=월요일, 6=일요일)
-        date_obj = dt(int(year), int(month), int(day))
-        day_of_week = date_obj.weekday()
+        day_of_week = date(year, month, day).weekday()
 
         return {
-            "year": int(year),
-            "month": int(month),
-            "day": int(day),
+            "year": year,
+            "month": month,
+            "day": day,
             "start_date": date_str,  # 원본 문자열
             "start_date_int": date_int,  # 정수형 (20250215 형식)
             "day_of_week": day_of_week,  # 0=월, 1=화, ..., 6=일
@@ -47,41 +128,37 @@ def extract_date_metadata(date_str: str) -> dict:
     return {}
 
 
-def extract_registration_metadata(row: dict) -> dict:
+def extract_registration_metadata(reg_start: str, reg_end: str) -> dict:
     """등록 기간 메타데이터 추출 (정수형 날짜로 비교 가능하게)."""
-    reg_start = row.get("등록 시작일", "")
-    reg_end = row.get("등록 마감일", "")
-
     result = {}
 
     # 등록 시작일 정수화
     if reg_start:
-        match = re.match(r"(\d{4})-(\d{2})-(\d{2})", reg_start)
-        if match:
-            result["reg_start_int"] = int(f"{match.group(1)}{match.group(2)}{match.group(3)}")
+        parsed = _parse_ymd(reg_start)
+        if parsed:
+            year, month, day = parsed
+            result["reg_start_int"] = year * 10000 + month * 100 + day
 
     # 등록 마감일 정수화
     if reg_end:
-        match = re.match(r"(\d{4})-(\d{2})-(\d{2})", reg_end)
-        if match:
-            result["reg_end_int"] = int(f"{match.group(1)}{match.group(2)}{match.group(3)}")
+        parsed = _parse_ymd(reg_end)
+        if parsed:
+            year, month, day = parsed
+            result["reg_end_int"] = year * 10000 + month * 100 + day
 
     return result
 
 
-def extract_duration_metadata(row: dict) -> dict:
+def extract_duration_metadata(start: str, end: str) -> dict:
     """행사 기간(일 수) 계산."""
-    from datetime import datetime as dt
-
-    start = row.get("행사 시작일", "")
-    end = row.get("행사 종료일", "")
+    from datetime import date
 
     if start and end:
+        # strptime 대신 슬라이싱 + ordinal 차 계산 (행마다 호출되는 핫 경로)
         try:
-            start_dt = dt.strptime(start, "%Y-%m-%d")
-            end_dt = dt.strptime(end, "%Y-%m-%d")
-            duration = (end_dt - start_dt).days + 1
-            return {"duration_days": max(1, duration)}
+            start_ord = date(int(start[:4]), int(start[5:7]), int(start[8:10])).toordinal()
+            end_ord = date(int(end[:4]), int(end[5:7]), int(end[8:10])).toordinal()
+            return {"duration_days": max(1, end_ord - start_ord + 1)}
         except ValueError:
             pass
 
@@ -94,68 +171,55 @@ def normalize_location(location: str) -> str:
         return ""
 
     # 1. 연속 공백을 단일 공백으로
-    normalized = re.sub(r"\s+", " ", location.strip())
+    normalized = _WS_RE.sub(" ", location.strip())
 
     # 2. "aT 센터" → "aT센터" (공백 제거)
-    normalized = re.sub(r"aT\s*센터", "aT센터", normalized)
+    normalized = _AT_CENTER_RE.sub("aT센터", normalized)
 
     # 3. "창조룸Ⅰ" → "창조룸 Ⅰ" (로마숫자 앞 공백 통일)
-    normalized = re.sub(r"창조룸\s*([ⅠⅡⅢⅣⅤⅰⅱⅲⅳⅴ])", r"창조룸 \1", normalized)
+    normalized = _CHANGJO_RE.sub(r"창조룸 \1", normalized)
 
     # 4. "세계로룸Ⅰ" → "세계로룸 Ⅰ"
-    normalized = re.sub(r"세계로룸\s*([ⅠⅡⅢⅣⅤⅰⅱⅲⅳⅴ])", r"세계로룸 \1", normalized)
+    normalized = _SEGYERO_RE.sub(r"세계로룸 \1", normalized)
 
     return normalized
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_category_from_event(event_name: str) -> str:
-    """Extract event category from event name."""
+    """Extract event category from event name (memoized - 행사명 반복이 많음)."""
     event_name_lower = event_name.lower()
 
-    category_patterns = [
-        (r"심포지엄|symposium", "심포지엄"),
-        (r"워크숍|workshop", "워크숍"),
-        (r"스쿨|school", "스쿨"),
-        (r"학술대회|conference", "학술대회"),
-        (r"교육|training|리더쉽", "교육"),
-        (r"세미나|seminar", "세미나"),
-    ]
-
-    for pattern, category in category_patterns:
-        if re.search(pattern, event_name_lower):
+    for pattern, category in _CATEGORY_PATTERNS:
+        if pattern.search(event_name_lower):
             return category
 
     return "기타"
 
 
-def extract_keywords_from_event(row: dict) -> list[str]:
-    """Extract keywords from event data."""
+def extract_keywords_from_event(event_name: str, location: str) -> list[str]:
+    """Extract keywords from event name and location."""
     keywords = []
 
-    event_name = row.get("행사명", "")
-    if event_name:
-        medical_patterns = [
-            r"(천식|COPD|ILD|NTM|폐암|결핵|폐기능|수면|호흡|금연|기침|폐혈관)",
-            r"(기관지확장증|감염병|환경성폐질환|분자폐암)",
-        ]
-        for pattern in medical_patterns:
-            matches = re.findall(pattern, event_name, re.IGNORECASE)
-            keywords.extend(matches)
-
-        event_type_matches = re.findall(
-            r"(심포지엄|워크숍|학술대회|교육|스쿨|세미나)", event_name
-        )
-        keywords.extend(event_type_matches)
-
-        org_matches = re.findall(r"(연구회|학회)", event_name)
-        keywords.extend(org_matches)
-
-    location = row.get("행사장소", "")
-    if location:
-        location_keywords = re.findall(r"(양재|aT센터|서울대|중앙대|성모병원|SC)", location)
-        keywords.extend(location_keywords)
-
-    keywords = list(set(keywords))
+    if ahocorasick is not None:
+        # 사전 전체를 한 번의 automaton 스캔으로 매칭 (O(텍스트 길이))
+        if event_name:
+            keywords.extend(kw for _, kw in _EVENT_AUTOMATON.iter(event_name.lower()))
+        if location:
+            keywords.extend(kw for _, kw in _LOCATION_AUTOMATON.iter(location.lower()))
+    else:
+        if event_name:
+            for pattern in _MEDICAL_PATTERNS:
+                keywords.extend(pattern.findall(event_name))
+
+            keywords.extend(_EVENT_TYPE_RE.findall(event_name))
+            keywords.extend(_ORG_RE.findall(event_name))
+
+        if location:
+            keywords.extend(_LOCATION_KW_RE.findall(location))
+
+    # dict.fromkeys: 중복 제거 + 입력 순서 유지 (노드 텍스트 결정성 → 임베딩 캐시 적중)
+    keywords = list(dict.fromkeys(keywords))
     return expand_keywords(keywords)
 
 
@@ -166,7 +230,7 @@ def generate_question_from_event(row: dict) -> str:
 
     if start_date:
         date_kr = convert_date_to_korean(start_date)
-        match = re.match(r"(\d{4})년 (\d{1,2})월", date_kr)
+        match = _KOREAN_YM_RE.match(date_kr)
         if match:
             year, month = match.groups()
             return f"{year}년 {month}월 {event_name} 일정과 장소는?"
@@ -174,32 +238,6 @@ def generate_question_from_event(row: dict) -> str:
     return f"{event_name} 일정과 장소는?"
 
 
-def generate_answer_from_event(row: dict) -> str:
-    """Generate a structured answer from event data."""
-    event_name = row.get("행사명", "")
-    start_date = convert_date_to_korean(row.get("행사 시작일", ""))
-    end_date = convert_date_to_korean(row.get("행사 종료일", ""))
-    location = row.get("행사장소", "")
-    reg_start = convert_date_to_korean(row.get("등록 시작일", ""))
-    reg_end = convert_date_to_korean(row.get("등록 마감일", ""))
-
-    answer_parts = [f"{event_name}"]
-
-    if start_date:
-        if start_date == end_date or not end_date:
-            answer_parts.append(f"일시: {start_date}")
-        else:
-            answer_parts.append(f"일시: {start_date} ~ {end_date}")
-
-    if location:
-        answer_parts.append(f"장소: {location}")
-
-    if reg_start and reg_end:
-        answer_parts.append(f"등록기간: {reg_start} ~ {reg_end}")
-
-    return "\n".join(answer_parts)
-
-
 def generate_explanation_from_event(row: dict) -> str:
     """Generate explanation from event data."""
     credits = row.get("평점", "")
@@ -214,55 +252,138 @@ def generate_explanation_from_event(row: dict) -> str:
     return "\n".join(explanation_parts) if explanation_parts else ""
 
 
-def build_node_text(row: dict, keywords: list[str]) -> str:
-    """Build Key-Value format text content for embedding."""
-    parts = []
+# load_csv가 참조하는 컬럼 (헤더에서 정수 인덱스로 변환)
+_CSV_COLUMNS = (
+    "행사명",
+    "행사 시작일",
+    "행사 종료일",
+    "행사장소",
+    "등록 시작일",
+    "등록 마감일",
+    "평점",
+    "url",
+)
+
+
+def _row_to_node(
+    path: Path,
+    idx: int,
+    event_name: str,
+    start_date: str,
+    end_date: str,
+    location_raw: str,
+    reg_start: str,
+    reg_end: str,
+    credits: str,
+    url: str,
+) -> TextNode:
+    """CSV 한 행을 단일 패스로 TextNode로 변환.
+
+    컬럼 값은 이미 로컬 문자열로 넘어오고, 파생 필드(날짜/카테고리/
+    키워드/노드 텍스트/답변 템플릿)를 한 번에 계산한다.
+    """
+    # 파생 필드 계산
+    date_meta = extract_date_metadata(start_date)
+    reg_meta = extract_registration_metadata(reg_start, reg_end)
+    duration_meta = extract_duration_metadata(start_date, end_date)
+    category = extract_category_from_event(event_name)
+    keywords = extract_keywords_from_event(event_name, location_raw)
 
-    # 행사명
-    event_name = row.get("행사명", "")
+    # Key-Value 형식 노드 텍스트 (임베딩용)
+    parts = []
     if event_name:
         parts.append(f"행사명: {event_name}")
-
-    # 날짜 정보
-    start_date = row.get("행사 시작일", "")
-    end_date = row.get("행사 종료일", "")
     if start_date:
         parts.append(f"행사 시작일: {start_date}")
     if end_date and end_date != start_date:
         parts.append(f"행사 종료일: {end_date}")
-
-    # 장소
-    location = row.get("행사장소", "")
-    if location:
-        parts.append(f"행사장소: {location}")
-
-    # 등록 기간
-    reg_start = row.get("등록 시작일", "")
-    reg_end = row.get("등록 마감일", "")
+    if location_raw:
+        parts.append(f"행사장소: {location_raw}")
     if reg_start:
         parts.append(f"등록 시작일: {reg_start}")
     if reg_end:
         parts.append(f"등록 마감일: {reg_end}")
-
-    # 평점
-    credits = row.get("평점", "")
     if credits:
         parts.append(f"평점: {credits}")
-
-    # URL
-    url = row.get("url", "")
     if url:
         parts.append(f"URL: {url}")
-
-    # 카테고리
-    category = extract_category_from_event(event_name)
     parts.append(f"카테고리: {category}")
-
-    # 키워드
     if keywords:
         parts.append(f"키워드: {', '.join(keywords)}")
+    text = "\n".join(parts)
 
-    return "\n".join(parts)
+    # 답변 템플릿 (LLM 컨텍스트용)
+    start_kr = convert_date_to_korean(start_date)
+    end_kr = convert_date_to_korean(end_date)
+    reg_start_kr = convert_date_to_korean(reg_start)
+    reg_end_kr = convert_date_to_korean(reg_end)
+
+    answer_parts = [f"{event_name}"]
+    if start_kr:
+        if start_kr == end_kr or not end_kr:
+            answer_parts.append(f"일시: {start_kr}")
+        else:
+            answer_parts.append(f"일시: {start_kr} ~ {end_kr}")
+    if location_raw:
+        answer_parts.append(f"장소: {location_raw}")
+    if reg_start_kr and reg_end_kr:
+        answer_parts.append(f"등록기간: {reg_start_kr} ~ {reg_end_kr}")
+    answer = "\n".join(answer_parts)
+
+    # 메타데이터 구성
+    metadata = {
+        "source": str(path),
+        "filename": path.name,
+        "row": idx,
+        "event_name": event_name,
+        "category": category,
+        "location": normalize_location(location_raw),
+        "location_normalized": canonical_location(location_raw) or "",  # canonical 장소명 ($eq 필터용)
+        "year": date_meta.get("year"),
+        "month": date_meta.get("month"),
+        "day": date_meta.get("day"),
+        "start_date": date_meta.get("start_date"),  # YYYY-MM-DD 문자열
+        "start_date_int": date_meta.get("start_date_int"),  # YYYYMMDD 정수
+        "day_of_week": date_meta.get("day_of_week"),  # 0=월 ~ 6=일
+        "is_weekend": date_meta.get("is_weekend"),  # 주말 여부
+        "reg_start_int": reg_meta.get("reg_start_int"),  # 등록 시작일 (정수)
+        "reg_end_int": reg_meta.get("reg_end_int"),  # 등록 마감일 (정수)
+        "duration_days": duration_meta.get("duration_days"),  # 행사 기간 (일)
+        "credits": credits,
+        "url": url,
+        "keywords": ",".join(keywords),
+        "answer_template": answer,
+    }
+
+    # None 값 제거
+    metadata = {k: v for k, v in metadata.items() if v is not None}
+
+    return TextNode(
+        text=text,
+        id_=f"csv_{path.stem}_{idx}",
+        metadata=metadata,
+    )
+
+
+# 이 행 수를 넘는 CSV는 pandas C 파서 경로 사용
+_PANDAS_MIN_ROWS = 500
+
+
+def _load_csv_pandas(path: Path) -> list[TextNode]:
+    """대형 CSV 전용: pandas C 파서로 컬럼 단위 일괄 로드 후 노드 생성."""
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    for col in _CSV_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+
+    # SoA 컬럼 리스트로 변환 후 행 단위로 노드 생성
+    columns = [df[col].tolist() for col in _CSV_COLUMNS]
+    return [
+        _row_to_node(path, idx, *values)
+        for idx, values in enumerate(zip(*columns), start=1)
+    ]
 
 
 def load_csv(file_path: str) -> list[TextNode]:
@@ -270,130 +391,132 @@ def load_csv(file_path: str) -> list[TextNode]:
     nodes = []
     path = Path(file_path)
 
+    # 대형 CSV는 pandas 벡터화 경로 (행 수는 개행 수로 근사, pandas 없으면 폴백)
+    if path.stat().st_size > 0:
+        with open(file_path, "rb") as f:
+            newline_count = f.read().count(b"\n")
+        if newline_count > _PANDAS_MIN_ROWS:
+            try:
+                return _load_csv_pandas(path)
+            except ImportError:
+                pass
+
     with open(file_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+
+        # 헤더를 한 번 읽어 컬럼명 → 정수 인덱스로 변환 (행마다 dict 생성 제거)
+        index_of = {name: i for i, name in enumerate(header)}
+        col_indices = [index_of.get(name, -1) for name in _CSV_COLUMNS]
+
         for idx, row in enumerate(reader, start=1):
-            # 데이터 추출
-            event_name = row.get("행사명", "")
-            start_date = row.get("행사 시작일", "")
-            date_meta = extract_date_metadata(start_date)
-            reg_meta = extract_registration_metadata(row)  # [신규] 등록 기간
-            duration_meta = extract_duration_metadata(row)  # [신규] 행사 기간
-            category = extract_category_from_event(event_name)
-            keywords = extract_keywords_from_event(row)
-
-            # Key-Value 형식 노드 텍스트 생성
-            text = build_node_text(row, keywords)
-
-            # 답변 템플릿 (LLM 컨텍스트용)
-            answer = generate_answer_from_event(row)
-
-            # 메타데이터 구성
-            metadata = {
-                "source": str(path),
-                "filename": path.name,
-                "row": idx,
-                "event_name": event_name,
-                "category": category,
-                "location": normalize_location(row.get("행사장소", "")),
-                "year": date_meta.get("year"),
-                "month": date_meta.get("month"),
-                "day": date_meta.get("day"),
-                "start_date": date_meta.get("start_date"),  # YYYY-MM-DD 문자열
-                "start_date_int": date_meta.get("start_date_int"),  # YYYYMMDD 정수
-                "day_of_week": date_meta.get("day_of_week"),  # 0=월 ~ 6=일
-                "is_weekend": date_meta.get("is_weekend"),  # 주말 여부
-                "reg_start_int": reg_meta.get("reg_start_int"),  # 등록 시작일 (정수)
-                "reg_end_int": reg_meta.get("reg_end_int"),  # 등록 마감일 (정수)
-                "duration_days": duration_meta.get("duration_days"),  # 행사 기간 (일)
-                "credits": row.get("평점", ""),
-                "url": row.get("url", ""),
-                "keywords": ",".join(keywords),
-                "answer_template": answer,
-            }
-
-            # None 값 제거
-            metadata = {k: v for k, v in metadata.items() if v is not None}
-
-            # TextNode 생성
-            node = TextNode(
-                text=text,
-                id_=f"csv_{path.stem}_{idx}",
-                metadata=metadata,
-            )
-            nodes.append(node)
+            row_len = len(row)
+            values = [
+                row[i] if 0 <= i < row_len else "" for i in col_indices
+            ]
+            nodes.append(_row_to_node(path, idx, *values))
 
     return nodes
 
 
+def _jsonl_row_to_node(data: dict, path: Path, line_num: int) -> TextNode:
+    """JSONL 레코드(dict)를 TextNode로 변환 (Pydantic 우회 - 직접 dict 접근).
+
+    인덱싱 경로에서는 검증이 필요 없어 기본은 직접 접근,
+    config.VALIDATE_JSONL=true 일 때만 Pydantic 검증 수행.
+    """
+    if config.VALIDATE_JSONL:
+        RAGDocument(**data)  # 검증만 수행 (실패 시 ValueError)
+
+    content = data.get("content") or {}
+    meta = data.get("metadata") or {}
+    boost = data.get("search_boost") or {}
+    keywords = data.get("keywords") or []
+
+    event_name = meta.get("event_name") or ""
+
+    # Key-Value 형식 텍스트 생성 (필드당 1회 조회, 빈 값은 한 번에 필터)
+    pairs = (
+        ("행사명", event_name),
+        ("행사 시작일", meta.get("start_date")),
+        ("행사 종료일", meta.get("end_date")),
+        ("행사장소", meta.get("location")),
+        ("평점", meta.get("credits")),
+        ("URL", meta.get("url")),
+        ("카테고리", meta.get("category")),
+    )
+    parts = [f"{label}: {value}" for label, value in pairs if value]
+    if keywords:
+        parts.append(f"키워드: {', '.join(keywords)}")
+    text = "\n".join(parts)
+
+    # start_date_int 계산
+    year = boost.get("year")
+    month = boost.get("month")
+    day = boost.get("day")
+    start_date_int = None
+    start_date = None
+    if year and month and day:
+        start_date = f"{year:04d}-{month:02d}-{day:02d}"
+        start_date_int = year * 10000 + month * 100 + day
+
+    metadata = {
+        "source": str(path),
+        "filename": path.name,
+        "row": line_num,
+        "event_name": event_name,
+        "category": extract_category_from_event(event_name),
+        "location": boost.get("location_normalized") or "",
+        "location_normalized": canonical_location(
+            meta.get("location") or boost.get("location_normalized") or ""
+        )
+        or "",
+        "year": year,
+        "month": month,
+        "day": day,
+        "start_date": start_date,
+        "start_date_int": start_date_int,
+        "keywords": ",".join(keywords),
+        "answer_template": content.get("answer", ""),
+    }
+
+    metadata = {k: v for k, v in metadata.items() if v is not None}
+
+    return TextNode(
+        text=text,
+        id_=data.get("id") or f"jsonl_{path.stem}_{line_num}",
+        metadata=metadata,
+    )
+
+
 def load_jsonl(file_path: str) -> list[TextNode]:
     """Load JSONL file and create TextNodes."""
     nodes = []
+    errors: list[tuple[int, ValueError]] = []
     path = Path(file_path)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, start=1):
-            if not line.strip():
-                continue
+    # 파일을 한 번에 읽고 메모리에서 라인 분리 (라인별 버퍼 I/O 제거)
+    raw = path.read_bytes()
+    for line_num, line in enumerate(raw.splitlines(), start=1):
+        if not line.strip(b"\r\n "):
+            continue
 
-            try:
-                data = json.loads(line)
-                rag_doc = RAGDocument(**data)
-
-                # Key-Value 형식 텍스트 생성
-                parts = []
-                if rag_doc.metadata.event_name:
-                    parts.append(f"행사명: {rag_doc.metadata.event_name}")
-                if rag_doc.metadata.start_date:
-                    parts.append(f"행사 시작일: {rag_doc.metadata.start_date}")
-                if rag_doc.metadata.end_date:
-                    parts.append(f"행사 종료일: {rag_doc.metadata.end_date}")
-                if rag_doc.metadata.location:
-                    parts.append(f"행사장소: {rag_doc.metadata.location}")
-                if rag_doc.metadata.credits:
-                    parts.append(f"평점: {rag_doc.metadata.credits}")
-                if rag_doc.metadata.url:
-                    parts.append(f"URL: {rag_doc.metadata.url}")
-                if rag_doc.metadata.category:
-                    parts.append(f"카테고리: {rag_doc.metadata.category}")
-                if rag_doc.keywords:
-                    parts.append(f"키워드: {', '.join(rag_doc.keywords)}")
-                text = "\n".join(parts)
-
-                # start_date_int 계산
-                start_date_int = None
-                start_date = None
-                if rag_doc.search_boost.year and rag_doc.search_boost.month and rag_doc.search_boost.day:
-                    start_date = f"{rag_doc.search_boost.year:04d}-{rag_doc.search_boost.month:02d}-{rag_doc.search_boost.day:02d}"
-                    start_date_int = int(f"{rag_doc.search_boost.year:04d}{rag_doc.search_boost.month:02d}{rag_doc.search_boost.day:02d}")
-
-                metadata = {
-                    "source": str(path),
-                    "filename": path.name,
-                    "row": line_num,
-                    "event_name": rag_doc.metadata.event_name or "",
-                    "category": extract_category_from_event(rag_doc.metadata.event_name or ""),
-                    "location": rag_doc.search_boost.location_normalized or "",
-                    "year": rag_doc.search_boost.year,
-                    "month": rag_doc.search_boost.month,
-                    "day": rag_doc.search_boost.day,
-                    "start_date": start_date,
-                    "start_date_int": start_date_int,
-                    "keywords": ",".join(rag_doc.keywords),
-                    "answer_template": rag_doc.content.answer,
-                }
-
-                metadata = {k: v for k, v in metadata.items() if v is not None}
-
-                node = TextNode(
-                    text=text,
-                    id_=rag_doc.id,
-                    metadata=metadata,
-                )
-                nodes.append(node)
-
-            except (json.JSONDecodeError, ValueError) as e:
-                print(f"Error parsing line {line_num} in {file_path}: {e}")
+        try:
+            data = _json.loads(line)
+            nodes.append(_jsonl_row_to_node(data, path, line_num))
+        except ValueError as e:
+            # JSONDecodeError(stdlib/orjson 모두 ValueError 서브클래스) + Pydantic 검증 실패
+            errors.append((line_num, e))
+
+    # 라인별 print는 Gradio의 stdout 캡처에서 병목 → 파일당 요약 한 줄만 출력
+    if errors:
+        first_line, first_error = errors[0]
+        print(
+            f"{file_path}: {len(errors)} bad lines "
+            f"(first: line {first_line}: {first_error})"
+        )
 
     return nodes
 
@@ -401,9 +524,7 @@ def load_jsonl(file_path: str) -> list[TextNode]:
 def load_markdown(file_path: str) -> list[TextNode]:
     """Load markdown file and create TextNode."""
     path = Path(file_path)
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = path.read_text(encoding="utf-8")
 
     node = TextNode(
         text=content,
@@ -416,8 +537,80 @@ def load_markdown(file_path: str) -> list[TextNode]:
     return [node]
 
 
+_LOADERS = {
+    ".csv": load_csv,
+    ".jsonl": load_jsonl,
+    ".md": load_markdown,
+}
+
+# 증분 인덱싱용 매니페스트 (파일 경로 → 내용 해시)
+_MANIFEST_NAME = ".docs_manifest.json"
+
+
+def compute_docs_manifest(docs_dir: str | None = None) -> dict[str, str]:
+    """docs 디렉터리의 파일별 내용 해시(sha1) 계산."""
+    if docs_dir is None:
+        docs_dir = config.DOCS_DIR
+
+    docs_path = Path(docs_dir)
+    if not docs_path.exists():
+        return {}
+
+    manifest = {}
+    for file_path in docs_path.rglob("*"):
+        if file_path.suffix in _LOADERS:
+            manifest[str(file_path)] = hashlib.sha1(
+                file_path.read_bytes()
+            ).hexdigest()
+    return manifest
+
+
+def load_docs_manifest(docs_dir: str | None = None) -> dict[str, str]:
+    """이전 인덱싱 시점의 매니페스트 로드."""
+    if docs_dir is None:
+        docs_dir = config.DOCS_DIR
+
+    manifest_path = Path(docs_dir) / _MANIFEST_NAME
+    if manifest_path.exists():
+        try:
+            return json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {}
+
+
+def save_docs_manifest(manifest: dict[str, str], docs_dir: str | None = None) -> None:
+    """인덱싱 완료 후 매니페스트 저장."""
+    if docs_dir is None:
+        docs_dir = config.DOCS_DIR
+
+    manifest_path = Path(docs_dir) / _MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+
+def load_files(file_paths: list[str]) -> list[TextNode]:
+    """Load specific files (증분 인덱싱 경로)."""
+    nodes = []
+    for file_path in file_paths:
+        nodes.extend(_load_file(file_path))
+    return nodes
+
+
+def _load_file(file_path: str) -> list[TextNode]:
+    """Load a single file by suffix (worker-safe for process pools)."""
+    loader = _LOADERS.get(Path(file_path).suffix)
+    if loader is None:
+        return []
+
+    try:
+        return loader(file_path)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return []
+
+
 def load_documents_from_dir(docs_dir: str | None = None) -> list[TextNode]:
-    """Load all documents from the docs directory."""
+    """Load all documents from the docs directory (parallel per file)."""
     if docs_dir is None:
         docs_dir = config.DOCS_DIR
 
@@ -425,16 +618,21 @@ def load_documents_from_dir(docs_dir: str | None = None) -> list[TextNode]:
     if not docs_path.exists():
         return []
 
+    file_paths = [
+        str(p) for p in docs_path.rglob("*") if p.suffix in _LOADERS
+    ]
+
     nodes = []
-    for file_path in docs_path.rglob("*"):
-        try:
-            if file_path.suffix == ".csv":
-                nodes.extend(load_csv(str(file_path)))
-            elif file_path.suffix == ".jsonl":
-                nodes.extend(load_jsonl(str(file_path)))
-            elif file_path.suffix == ".md":
-                nodes.extend(load_markdown(str(file_path)))
-        except Exception as e:
-            print(f"Error loading {file_path}: {e}")
+
+    # 파일이 적으면 프로세스 풀 기동 비용이 더 큼 → 순차 처리
+    if len(file_paths) <= 2:
+        for file_path in file_paths:
+            nodes.extend(_load_file(file_path))
+        return nodes
+
+    # CPU 바운드 파싱(정규식+csv)이라 파일 단위 프로세스 병렬화
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_nodes in executor.map(_load_file, file_paths):
+            nodes.extend(file_nodes)
 
     return nodes
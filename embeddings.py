@@ -1,11 +1,83 @@
 """LlamaIndex 임베딩 설정 - 한국어 특화."""
 
+import hashlib
+import sqlite3
+
+import numpy as np
 from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 
 import config
 
 # 싱글톤 인스턴스
 _embed_model: HuggingFaceEmbedding | None = None
+_cache_conn: sqlite3.Connection | None = None
+
+
+def _get_cache_conn() -> sqlite3.Connection:
+    """Get the embedding cache DB connection (singleton)."""
+    global _cache_conn
+
+    if _cache_conn is None:
+        _cache_conn = sqlite3.connect(config.EMBED_CACHE_DB, check_same_thread=False)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB)"
+        )
+        _cache_conn.commit()
+
+    return _cache_conn
+
+
+def _text_hash(text: str) -> bytes:
+    """Content hash used as the cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class CachedHuggingFaceEmbedding(HuggingFaceEmbedding):
+    """HuggingFaceEmbedding with a persistent content-hash cache.
+
+    노드 텍스트를 해시하여 sqlite 캐시에서 먼저 조회하고,
+    캐시 미스만 배치로 GPU 임베딩 → 재인덱싱 시 변경된 행만 계산.
+    """
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        conn = _get_cache_conn()
+        hashes = [_text_hash(t) for t in texts]
+
+        # 캐시 조회 (bulk SELECT)
+        cached: dict[bytes, list[float]] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        placeholders = ",".join("?" * len(unique_hashes))
+        rows = conn.execute(
+            f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+            unique_hashes,
+        )
+        for h, vec_blob in rows:
+            cached[h] = np.frombuffer(vec_blob, dtype=np.float32).tolist()
+
+        # 캐시 미스만 배치 임베딩
+        miss_indices = [i for i, h in enumerate(hashes) if h not in cached]
+        if miss_indices:
+            miss_texts = [texts[i] for i in miss_indices]
+            miss_vecs = super()._get_text_embeddings(miss_texts)
+
+            new_rows = []
+            for i, vec in zip(miss_indices, miss_vecs):
+                cached[hashes[i]] = vec
+                new_rows.append(
+                    (hashes[i], np.asarray(vec, dtype=np.float32).tobytes())
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, vec) VALUES (?, ?)",
+                new_rows,
+            )
+            conn.commit()
+
+        return [cached[h] for h in hashes]
+
+
+def is_model_loaded() -> bool:
+    """임베딩 모델 로딩 여부 (상태 표시용 - 로딩을 유발하지 않음)."""
+    return _embed_model is not None
 
 
 def get_embed_model() -> HuggingFaceEmbedding:
@@ -13,10 +85,20 @@ def get_embed_model() -> HuggingFaceEmbedding:
     global _embed_model
 
     if _embed_model is None:
-        print("[초기화] 임베딩 모델 로딩 중...")
-        _embed_model = HuggingFaceEmbedding(
+        import torch
+
+        # CUDA 없는 호스트는 CPU 폴백, GPU에서는 FP16으로 처리량 2배
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model_kwargs = {}
+        if device == "cuda":
+            model_kwargs["torch_dtype"] = torch.float16
+
+        print(f"[초기화] 임베딩 모델 로딩 중... (device={device})")
+        _embed_model = CachedHuggingFaceEmbedding(
             model_name=config.EMBEDDING_MODEL,
-            device="cuda",
+            device=device,
+            embed_batch_size=config.EMBED_BATCH_SIZE,
+            model_kwargs=model_kwargs,
         )
         print("[초기화] 임베딩 모델 로딩 완료")
 
@@ -1,6 +1,7 @@
 """MinIO client for document synchronization."""
 
-import os
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from minio import Minio
@@ -8,15 +9,30 @@ from minio.error import S3Error
 
 import config
 
+# 문서로 취급하는 확장자
+_DOC_SUFFIXES = (".md", ".csv", ".jsonl")
+
+# 다운로드 병렬도 (I/O 바운드 - 네트워크 지연 은닉)
+_DOWNLOAD_WORKERS = 16
+
+
+# 싱글톤 인스턴스 (Minio 클라이언트는 스레드 안전 - 연결 풀 재사용)
+_client: Minio | None = None
+
 
 def get_client() -> Minio:
-    """Create and return a MinIO client."""
-    return Minio(
-        config.MINIO_ENDPOINT,
-        access_key=config.MINIO_ACCESS_KEY,
-        secret_key=config.MINIO_SECRET_KEY,
-        secure=config.MINIO_SECURE,
-    )
+    """Get the MinIO client (singleton)."""
+    global _client
+
+    if _client is None:
+        _client = Minio(
+            config.MINIO_ENDPOINT,
+            access_key=config.MINIO_ACCESS_KEY,
+            secret_key=config.MINIO_SECRET_KEY,
+            secure=config.MINIO_SECURE,
+        )
+
+    return _client
 
 
 def ensure_bucket(client: Minio, bucket_name: str) -> None:
@@ -25,10 +41,30 @@ def ensure_bucket(client: Minio, bucket_name: str) -> None:
         client.make_bucket(bucket_name)
 
 
+def _load_etags(docs_dir: Path) -> dict[str, str]:
+    """이전 동기화의 object_name → etag 매핑 로드."""
+    etag_path = docs_dir / ".etags.json"
+    if etag_path.exists():
+        try:
+            return json.loads(etag_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {}
+
+
+def _save_etags(docs_dir: Path, etags: dict[str, str]) -> None:
+    """동기화 후 etag 매핑 저장."""
+    etag_path = docs_dir / ".etags.json"
+    etag_path.write_text(json.dumps(etags, ensure_ascii=False), encoding="utf-8")
+
+
 def sync_documents(client: Minio | None = None) -> list[str]:
     """
     Sync documents from MinIO bucket to local directory.
 
+    항상 전체 LIST를 스트리밍으로 순회하되, 크기 + etag가 같은 객체는
+    다운로드를 생략한다 (재동기화 비용은 LIST 1회 + 로컬 stat 수준).
+
     Returns:
         List of downloaded file paths.
     """
@@ -38,22 +74,39 @@ def sync_documents(client: Minio | None = None) -> list[str]:
     docs_dir = Path(config.DOCS_DIR)
     docs_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded = []
+    etags = _load_etags(docs_dir)
+
+    def download(obj) -> str:
+        local_path = docs_dir / obj.object_name
+
+        # 크기 + etag가 같으면 이미 동기화된 파일 → 다운로드 생략
+        if (
+            local_path.exists()
+            and local_path.stat().st_size == obj.size
+            and etags.get(obj.object_name) == obj.etag
+        ):
+            return str(local_path)
+
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        client.fget_object(
+            config.MINIO_BUCKET,
+            obj.object_name,
+            str(local_path),
+        )
+        etags[obj.object_name] = obj.etag
+        return str(local_path)
 
     try:
         objects = client.list_objects(config.MINIO_BUCKET, recursive=True)
+        targets = [
+            obj for obj in objects if obj.object_name.endswith(_DOC_SUFFIXES)
+        ]
 
-        for obj in objects:
-            if obj.object_name.endswith((".md", ".csv")):
-                local_path = docs_dir / obj.object_name
-                local_path.parent.mkdir(parents=True, exist_ok=True)
+        # 다운로드는 I/O 바운드 → 스레드 풀로 RTT 합산 대신 병렬 처리
+        with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+            downloaded = list(executor.map(download, targets))
 
-                client.fget_object(
-                    config.MINIO_BUCKET,
-                    obj.object_name,
-                    str(local_path),
-                )
-                downloaded.append(str(local_path))
+        _save_etags(docs_dir, etags)
 
     except S3Error as e:
         print(f"MinIO error: {e}")
@@ -71,7 +124,7 @@ def list_remote_files(client: Minio | None = None) -> list[str]:
     try:
         objects = client.list_objects(config.MINIO_BUCKET, recursive=True)
         for obj in objects:
-            if obj.object_name.endswith((".md", ".csv")):
+            if obj.object_name.endswith(_DOC_SUFFIXES):
                 files.append(obj.object_name)
     except S3Error as e:
         print(f"MinIO error: {e}")
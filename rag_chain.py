@@ -1,35 +1,151 @@
 """LlamaIndex RAG 체인 - 메타데이터 필터링 지원."""
 
+import atexit
+import functools
 import re
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import Generator
 
+import httpx
+import numpy as np
+import ollama
+
 from llama_index.core import PromptTemplate, Settings
 from llama_index.core.vector_stores import MetadataFilters, MetadataFilter, FilterOperator
 from llama_index.llms.ollama import Ollama
 
 import config
-from vector_store import get_index, get_all_by_filter
+from schema import canonical_location
+from vector_store import RowBatch, get_index, get_all_by_filter, get_documents_by_ids
 from embeddings import get_embed_model
 
 
-def get_today_korean() -> str:
+def get_today_korean(now: datetime | None = None) -> str:
     """Get today's date in Korean format."""
-    today = datetime.now()
+    today = now or datetime.now()
     return f"{today.year}년 {today.month}월 {today.day}일"
 
+# 쿼리 파싱용 정규식 사전 컴파일 (chat() 핫 패스에서 매 요청 재사용)
+_YEAR_RE = re.compile(r"(\d{4})년")
+# 기간 키워드 6종을 named group 하나의 교대 패턴으로 융합 (1패스 스캔)
+_PERIOD_RE = re.compile(
+    r"(?P<half1>상반기|1반기|전반기)"
+    r"|(?P<half2>하반기|2반기|후반기)"
+    r"|(?P<q1>1분기|1사분기)"
+    r"|(?P<q2>2분기|2사분기)"
+    r"|(?P<q3>3분기|3사분기)"
+    r"|(?P<q4>4분기|4사분기)"
+)
+_PERIOD_MONTHS = {
+    "half1": [1, 2, 3, 4, 5, 6],
+    "half2": [7, 8, 9, 10, 11, 12],
+    "q1": [1, 2, 3],
+    "q2": [4, 5, 6],
+    "q3": [7, 8, 9],
+    "q4": [10, 11, 12],
+}
+_MONTH_RANGE_RE = re.compile(r"(\d{1,2})월\s*[~\-부터]\s*(\d{1,2})월")
+_MONTH_RE = re.compile(r"(\d{1,2})월")
+
+# 카테고리도 named group 교대 패턴 하나로 1패스 매칭
+_CATEGORY_RE = re.compile(
+    r"(?P<symposium>심포지엄|심포지움)"
+    r"|(?P<workshop>워크숍|워크샵)"
+    r"|(?P<school>스쿨|school)"
+    r"|(?P<conference>학술대회)"
+    r"|(?P<education>교육|연수|리더쉽)"
+    r"|(?P<seminar>세미나)"
+)
+_CATEGORY_NAMES = {
+    "symposium": "심포지엄",
+    "workshop": "워크숍",
+    "school": "스쿨",
+    "conference": "학술대회",
+    "education": "교육",
+    "seminar": "세미나",
+}
+
+
+def _priority_match(pattern: re.Pattern, text: str) -> str | None:
+    """교대 패턴의 매치 중 그룹 선언 순서상 가장 앞선 그룹명 반환.
+
+    search()는 가장 왼쪽 매치를 고르므로 기존 패턴 리스트의 우선순위
+    의미가 깨진다 ("워크숍 말고 심포지엄"은 심포지엄으로 분류돼야 함).
+    전체를 1패스 스캔한 뒤 groupindex(선언 순서)로 선택한다.
+    """
+    best = None
+    best_rank = len(pattern.groupindex) + 1
+    for match in pattern.finditer(text):
+        rank = pattern.groupindex[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match.lastgroup, rank
+            if rank == 1:  # 최우선 그룹이면 더 볼 필요 없음
+                break
+    return best
+
+_CREDIT_RE = re.compile(r"(\d+)\s*(?:평점|점)")
+_ORG_PATTERNS = [
+    (re.compile(r"대한의사협회|의사협회|의협"), "대한의사협회"),
+    (re.compile(r"내과분과|내과"), "내과분과"),
+    (re.compile(r"대한임상병리사협회|임상병리사"), "대한임상병리사협회"),
+]
+
+_WEEKEND_RE = re.compile(r"주말|토요일|일요일|토,?\s*일|토·일")
+_WEEKDAY_RE = re.compile(r"평일|월요일|화요일|수요일|목요일|금요일|월~금")
+
+_REG_AVAILABLE_RE = re.compile(r"등록.*(가능|신청|접수)|지금.*(신청|등록)|당장.*(신청|등록)")
+_REG_CLOSING_RE = re.compile(r"등록.*(마감|임박)|마감.*(임박|급|곧)|일주일.*(안|내).*마감")
+_REG_UPCOMING_RE = re.compile(r"등록.*(전|대기|시작.*전)|아직.*등록.*(안|전)")
+_REG_EXCLUDE_RE = re.compile(r"등록.*(마감|끝|지난).*(제외|빼)|마감.*제외")
+
+_DURATION_MULTI_RE = re.compile(r"며칠|여러\s*날|장기|이틀|[23]일간|연속|동안\s*진행")
+_DURATION_SINGLE_RE = re.compile(r"하루|당일|단기|하루\s*만")
+
+_PAGINATION_PATTERNS = [
+    re.compile(r"더\s*(보여|알려|줘)"),
+    re.compile(r"추가로\s*(보여|알려|줘)"),
+    re.compile(r"다음\s*(목록|페이지|결과)"),
+    re.compile(r"나머지"),
+    re.compile(r"더\s*있"),
+    re.compile(r"계속"),
+    re.compile(r"다음으로"),
+    re.compile(r"추가\s*목록"),
+    re.compile(r"더\s*많이"),
+]
+
+_EXCLUSION_RE = re.compile(
+    r"(?P<cat>심포지엄|워크숍|스쿨|세미나|교육).*?(?:말고|제외|빼고|아니고|외)"
+)
+
+_TIME_PATTERNS = [
+    re.compile(r"가장\s*빠른"),
+    re.compile(r"가장\s*빨리"),
+    re.compile(r"가장\s*가까운"),
+    re.compile(r"오늘\s*이후"),
+    re.compile(r"내일\s*이후"),
+    re.compile(r"다음\s*행사"),
+    re.compile(r"가까운\s*행사"),
+    re.compile(r"다가오는"),
+    re.compile(r"예정된"),
+    re.compile(r"곧\s*있는"),
+    re.compile(r"앞으로"),
+    re.compile(r"오늘\s*기준"),
+    re.compile(r"이번\s*달"),
+    re.compile(r"이번\s*주"),
+]
+
 # 싱글톤 인스턴스
 _llm: Ollama | None = None
 
 # 페이지네이션 상태
-_last_search_results: list = []
+_last_search_results: RowBatch | list = []
 _last_search_offset: int = 0
 _last_search_query: str = ""
 
-def get_system_prompt() -> str:
-    """Get system prompt with current date."""
-    today = get_today_korean()
-    today_date = datetime.now().strftime("%Y-%m-%d")
+@functools.lru_cache(maxsize=2)
+def _system_prompt_for(today: str, today_date: str) -> str:
+    """날짜 문자열 기준 시스템 프롬프트 구성 (하루 단위 캐시)."""
     return f"""당신은 사내 문서를 기반으로 질문에 답변하는 한국어 AI 어시스턴트입니다.
 
 ## 기준 정보
@@ -64,9 +180,20 @@ def get_system_prompt() -> str:
 - 예: "어떤 행사를 말씀하시는 건가요?"
 """
 
-def get_qa_prompt() -> PromptTemplate:
-    """Get QA prompt with current date."""
-    today = get_today_korean()
+
+def get_system_prompt(now: datetime | None = None) -> str:
+    """Get system prompt with current date.
+
+    프롬프트 본문은 날짜가 바뀔 때만 달라지므로 날짜 문자열 키로
+    캐시 - 요청마다 수 KB f-string을 재조립하지 않는다.
+    """
+    now = now or datetime.now()
+    return _system_prompt_for(get_today_korean(now), now.strftime("%Y-%m-%d"))
+
+
+@functools.lru_cache(maxsize=2)
+def _qa_prompt_for(today: str) -> PromptTemplate:
+    """날짜 문자열 기준 QA 프롬프트 템플릿 구성 (하루 단위 캐시)."""
     return PromptTemplate(
         f"""\
 오늘 날짜: {today}
@@ -86,28 +213,77 @@ def get_qa_prompt() -> PromptTemplate:
     )
 
 
+def get_qa_prompt(now: datetime | None = None) -> PromptTemplate:
+    """Get QA prompt with current date.
+
+    같은 날짜에는 동일한 PromptTemplate 객체를 재사용한다.
+    """
+    return _qa_prompt_for(get_today_korean(now or datetime.now()))
+
+
+def is_llm_connected() -> bool:
+    """LLM 연결 여부 (상태 표시용 - 연결을 유발하지 않음)."""
+    return _llm is not None
+
+
+def _close_llm_client() -> None:
+    """프로세스 종료 시 keep-alive 커넥션 정리 (best-effort)."""
+    if _llm is None:
+        return
+    inner = getattr(getattr(_llm, "client", None), "_client", None)
+    if inner is not None:
+        try:
+            inner.close()
+        except Exception:
+            pass
+
+
 def get_llm() -> Ollama:
     """Get the Ollama LLM instance (singleton)."""
     global _llm
 
     if _llm is None:
         print("[초기화] LLM 연결 중...")
+        # 요청마다 TCP 핸드셰이크를 반복하지 않도록 keep-alive 풀 공유.
+        # Ollama 생성자는 client_kwargs를 받지 않으므로 (pydantic이 무시)
+        # ollama.Client를 직접 구성해 client=로 전달한다.
+        client = ollama.Client(
+            host=config.OLLAMA_BASE_URL,
+            transport=httpx.HTTPTransport(retries=3),
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                keepalive_expiry=30.0,
+            ),
+        )
         _llm = Ollama(
             model=config.OLLAMA_MODEL,
             base_url=config.OLLAMA_BASE_URL,
             request_timeout=120.0,
+            client=client,
         )
+        atexit.register(_close_llm_client)
         print("[초기화] LLM 연결 완료")
 
     return _llm
 
 
+_settings_ready = False
+
+
 def setup_settings() -> None:
-    """Configure global LlamaIndex settings."""
+    """Configure global LlamaIndex settings (프로세스당 1회만 수행)."""
+    global _settings_ready
+
+    if _settings_ready:
+        return
+
     Settings.llm = get_llm()
     Settings.embed_model = get_embed_model()
     Settings.chunk_size = config.CHUNK_SIZE
     Settings.chunk_overlap = config.CHUNK_OVERLAP
+    _settings_ready = True
 
 
 def parse_date_from_query(query: str) -> tuple[int | None, int | None, list[int] | None]:
@@ -121,26 +297,17 @@ def parse_date_from_query(query: str) -> tuple[int | None, int | None, list[int]
     month_range = None
 
     # 연도 파싱
-    year_match = re.search(r"(\d{4})년", query)
+    year_match = _YEAR_RE.search(query)
     if year_match:
         year = int(year_match.group(1))
 
-    # 기간 키워드 파싱 (상반기, 하반기, 분기 등)
-    if re.search(r"상반기|1반기|전반기", query):
-        month_range = [1, 2, 3, 4, 5, 6]
-    elif re.search(r"하반기|2반기|후반기", query):
-        month_range = [7, 8, 9, 10, 11, 12]
-    elif re.search(r"1분기|1사분기", query):
-        month_range = [1, 2, 3]
-    elif re.search(r"2분기|2사분기", query):
-        month_range = [4, 5, 6]
-    elif re.search(r"3분기|3사분기", query):
-        month_range = [7, 8, 9]
-    elif re.search(r"4분기|4사분기", query):
-        month_range = [10, 11, 12]
+    # 기간 키워드 파싱 (상반기, 하반기, 분기 등) - 융합 패턴 1회 스캔
+    period_group = _priority_match(_PERIOD_RE, query)
+    if period_group:
+        month_range = _PERIOD_MONTHS[period_group]
 
     # 명시적 월 범위 파싱 (예: "1월~6월", "3월부터 5월까지", "1월-6월")
-    range_match = re.search(r"(\d{1,2})월\s*[~\-부터]\s*(\d{1,2})월", query)
+    range_match = _MONTH_RANGE_RE.search(query)
     if range_match:
         start_month = int(range_match.group(1))
         end_month = int(range_match.group(2))
@@ -149,7 +316,7 @@ def parse_date_from_query(query: str) -> tuple[int | None, int | None, list[int]
 
     # 단일 월 파싱 (범위가 없는 경우에만)
     if month_range is None:
-        month_match = re.search(r"(\d{1,2})월", query)
+        month_match = _MONTH_RE.search(query)
         if month_match:
             month = int(month_match.group(1))
 
@@ -158,19 +325,9 @@ def parse_date_from_query(query: str) -> tuple[int | None, int | None, list[int]
 
 def parse_category_from_query(query: str) -> str | None:
     """Extract event category from query string."""
-    category_patterns = [
-        (r"심포지엄|심포지움", "심포지엄"),
-        (r"워크숍|워크샵", "워크숍"),
-        (r"스쿨|school", "스쿨"),
-        (r"학술대회", "학술대회"),
-        (r"교육|연수|리더쉽", "교육"),
-        (r"세미나", "세미나"),
-    ]
-
-    query_lower = query.lower()
-    for pattern, category in category_patterns:
-        if re.search(pattern, query_lower):
-            return category
+    group = _priority_match(_CATEGORY_RE, query.lower())
+    if group:
+        return _CATEGORY_NAMES[group]
 
     return None
 
@@ -185,34 +342,28 @@ def parse_credits_from_query(query: str) -> tuple[int | None, str | None]:
     organization = None
 
     # 평점 숫자 파싱 (4점, 4평점 모두 인식)
-    credit_match = re.search(r"(\d+)\s*(?:평점|점)", query)
+    credit_match = _CREDIT_RE.search(query)
     if credit_match:
         credit_value = int(credit_match.group(1))
 
     # 기관명 파싱
-    org_patterns = [
-        (r"대한의사협회|의사협회|의협", "대한의사협회"),
-        (r"내과분과|내과", "내과분과"),
-        (r"대한임상병리사협회|임상병리사", "대한임상병리사협회"),
-    ]
-    for pattern, org_name in org_patterns:
-        if re.search(pattern, query):
+    for pattern, org_name in _ORG_PATTERNS:
+        if pattern.search(query):
             organization = org_name
             break
 
     return credit_value, organization
 
 
-def filter_nodes_by_credits(nodes: list, credit_value: int | None, organization: str | None) -> list:
-    """Filter nodes by credits (Python post-processing)."""
+def filter_batch_by_credits(
+    batch: RowBatch, credit_value: int | None, organization: str | None
+) -> RowBatch:
+    """Filter rows by credits (Python post-processing, 컬럼 1회 순회)."""
     if credit_value is None and organization is None:
-        return nodes
-
-    filtered = []
-    for node in nodes:
-        metadata = node.metadata if hasattr(node, 'metadata') else {}
-        credits = metadata.get("credits", "")
+        return batch
 
+    indices = []
+    for i, credits in enumerate(batch.credits):
         # 평점 값 확인
         if credit_value is not None:
             if f"{credit_value}평점" not in credits and credits != str(credit_value):
@@ -223,28 +374,14 @@ def filter_nodes_by_credits(nodes: list, credit_value: int | None, organization:
             if organization not in credits:
                 continue
 
-        filtered.append(node)
+        indices.append(i)
 
-    return filtered
+    return batch.take(indices)
 
 
 def parse_location_from_query(query: str) -> str | None:
     """Extract location keyword from query string."""
-    location_patterns = [
-        (r"양재\s*aT\s*센터", "양재 aT센터"),
-        (r"서울대", "서울대"),
-        (r"코엑스", "코엑스"),
-        (r"벡스코", "벡스코"),
-        (r"SC\s*컨벤션", "SC 컨벤션센터"),
-        (r"성모병원", "성모병원"),
-        (r"중앙대", "중앙대"),
-    ]
-
-    for pattern, normalized in location_patterns:
-        if re.search(pattern, query, re.IGNORECASE):
-            return normalized
-
-    return None
+    return canonical_location(query)
 
 
 def parse_weekend_filter(query: str) -> bool | None:
@@ -255,9 +392,9 @@ def parse_weekend_filter(query: str) -> bool | None:
         False: 평일만
         None: 필터 없음
     """
-    if re.search(r"주말|토요일|일요일|토,?\s*일|토·일", query):
+    if _WEEKEND_RE.search(query):
         return True
-    if re.search(r"평일|월요일|화요일|수요일|목요일|금요일|월~금", query):
+    if _WEEKDAY_RE.search(query):
         return False
     return None
 
@@ -273,13 +410,13 @@ def parse_registration_filter(query: str) -> str | None:
         None: 필터 없음
     """
     # "등록"이 포함된 경우에만 등록 상태 필터 적용
-    if re.search(r"등록.*(가능|신청|접수)|지금.*(신청|등록)|당장.*(신청|등록)", query):
+    if _REG_AVAILABLE_RE.search(query):
         return "available"
-    if re.search(r"등록.*(마감|임박)|마감.*(임박|급|곧)|일주일.*(안|내).*마감", query):
+    if _REG_CLOSING_RE.search(query):
         return "closing_soon"
-    if re.search(r"등록.*(전|대기|시작.*전)|아직.*등록.*(안|전)", query):
+    if _REG_UPCOMING_RE.search(query):
         return "upcoming"
-    if re.search(r"등록.*(마감|끝|지난).*(제외|빼)|마감.*제외", query):
+    if _REG_EXCLUDE_RE.search(query):
         return "exclude_closed"
     return None
 
@@ -292,28 +429,17 @@ def parse_duration_filter(query: str) -> str | None:
         "single_day": 하루 행사
         None: 필터 없음
     """
-    if re.search(r"며칠|여러\s*날|장기|이틀|[23]일간|연속|동안\s*진행", query):
+    if _DURATION_MULTI_RE.search(query):
         return "multi_day"
-    if re.search(r"하루|당일|단기|하루\s*만", query):
+    if _DURATION_SINGLE_RE.search(query):
         return "single_day"
     return None
 
 
 def is_pagination_request(query: str) -> bool:
     """Check if query is asking for more results."""
-    patterns = [
-        r"더\s*(보여|알려|줘)",
-        r"추가로\s*(보여|알려|줘)",
-        r"다음\s*(목록|페이지|결과)",
-        r"나머지",
-        r"더\s*있",
-        r"계속",
-        r"다음으로",
-        r"추가\s*목록",
-        r"더\s*많이",
-    ]
-    for pattern in patterns:
-        if re.search(pattern, query):
+    for pattern in _PAGINATION_PATTERNS:
+        if pattern.search(query):
             return True
     return False
 
@@ -324,35 +450,70 @@ def parse_exclusion_filter(query: str) -> str | None:
     Returns:
         제외할 카테고리명 또는 None
     """
-    patterns = [
-        (r"심포지엄.*(말고|제외|빼고|아니고|외)", "심포지엄"),
-        (r"워크숍.*(말고|제외|빼고|아니고|외)", "워크숍"),
-        (r"스쿨.*(말고|제외|빼고|아니고|외)", "스쿨"),
-        (r"세미나.*(말고|제외|빼고|아니고|외)", "세미나"),
-        (r"교육.*(말고|제외|빼고|아니고|외)", "교육"),
-    ]
-    for pattern, category in patterns:
-        if re.search(pattern, query):
-            return category
-    return None
+    match = _EXCLUSION_RE.search(query)
+    return match.group("cat") if match else None
+
+
+@dataclass(frozen=True)
+class QueryFilters:
+    """쿼리 1회 파싱 결과 (chat 파이프라인 전체가 공유)."""
+
+    year: int | None = None
+    month: int | None = None
+    month_range: tuple[int, ...] | None = None
+    category: str | None = None
+    exclusion: str | None = None
+    location: str | None = None
+    credit_value: int | None = None
+    credit_org: str | None = None
+    is_weekend: bool | None = None
+    reg_status: str | None = None
+    duration: str | None = None
+    time_based: bool = False
+
+
+@functools.lru_cache(maxsize=512)
+def parse_query(query: str) -> QueryFilters:
+    """쿼리를 한 번만 파싱해 모든 필터 필드를 담은 QueryFilters 반환.
+
+    기존에는 chat()과 build_filter_description()이 같은 parse_* 군을
+    각각 다시 호출해 쿼리를 10회 이상 스캔했다. 결과는 메시지 문자열
+    기준 LRU 캐시 - 반복 질문은 파싱 자체를 건너뛴다.
+    """
+    year, month, month_range = parse_date_from_query(query)
+    credit_value, credit_org = parse_credits_from_query(query)
+
+    return QueryFilters(
+        year=year,
+        month=month,
+        month_range=tuple(month_range) if month_range else None,
+        category=parse_category_from_query(query),
+        exclusion=parse_exclusion_filter(query),
+        location=parse_location_from_query(query),
+        credit_value=credit_value,
+        credit_org=credit_org,
+        is_weekend=parse_weekend_filter(query),
+        reg_status=parse_registration_filter(query),
+        duration=parse_duration_filter(query),
+        time_based=is_time_based_query(query),
+    )
 
 
 def build_metadata_filters(query: str) -> MetadataFilters | None:
     """Build metadata filters from query string (for LlamaIndex)."""
+    qf = parse_query(query)
     filters = []
 
-    # 연도 필터
-    year, month, month_range = parse_date_from_query(query)
-    if year:
-        filters.append(MetadataFilter(key="year", value=year, operator=FilterOperator.EQ))
-    if month:
-        filters.append(MetadataFilter(key="month", value=month, operator=FilterOperator.EQ))
+    # 연도/월 필터
+    if qf.year:
+        filters.append(MetadataFilter(key="year", value=qf.year, operator=FilterOperator.EQ))
+    if qf.month:
+        filters.append(MetadataFilter(key="month", value=qf.month, operator=FilterOperator.EQ))
     # 참고: LlamaIndex MetadataFilter는 $in 미지원, month_range는 ChromaDB 직접 필터에서만 사용
 
     # 카테고리 필터
-    category = parse_category_from_query(query)
-    if category:
-        filters.append(MetadataFilter(key="category", value=category, operator=FilterOperator.EQ))
+    if qf.category:
+        filters.append(MetadataFilter(key="category", value=qf.category, operator=FilterOperator.EQ))
 
     if filters:
         return MetadataFilters(filters=filters)
@@ -361,109 +522,108 @@ def build_metadata_filters(query: str) -> MetadataFilters | None:
 
 def is_time_based_query(query: str) -> bool:
     """Check if query is asking about upcoming/nearest events."""
-    time_patterns = [
-        r"가장\s*빠른",
-        r"가장\s*빨리",
-        r"가장\s*가까운",
-        r"오늘\s*이후",
-        r"내일\s*이후",
-        r"다음\s*행사",
-        r"가까운\s*행사",
-        r"다가오는",
-        r"예정된",
-        r"곧\s*있는",
-        r"앞으로",
-        r"오늘\s*기준",
-        r"이번\s*달",
-        r"이번\s*주",
-    ]
-    for pattern in time_patterns:
-        if re.search(pattern, query):
+    for pattern in _TIME_PATTERNS:
+        if pattern.search(query):
             return True
     return False
 
 
-def build_chroma_filters(query: str) -> dict | None:
-    """Build ChromaDB where clause from query string."""
-    conditions = []
+def build_chroma_filters(qf: QueryFilters, today_int: int | None = None) -> dict | None:
+    """Build ChromaDB where clause from parsed query filters.
 
-    # 연도/월/월범위 파싱
-    year, month, month_range = parse_date_from_query(query)
+    today_int은 요청당 1회 계산해 넘기는 것을 권장 (미지정 시 자체 계산).
+    """
+    # 단일 필터 fast-path: 연도/월/카테고리만 있는 흔한 쿼리는 8개 필터
+    # 블록을 순회하지 않고 dict 리터럴로 즉시 반환 ($and 래핑도 없음)
+    if not (
+        qf.time_based
+        or qf.month_range
+        or qf.is_weekend is not None
+        or qf.exclusion
+        or qf.reg_status
+        or qf.duration
+        or qf.location
+    ):
+        if qf.year and not (qf.month or qf.category):
+            return {"year": {"$eq": qf.year}}
+        if qf.month and not (qf.year or qf.category):
+            return {"month": {"$eq": qf.month}}
+        if qf.category and not (qf.year or qf.month):
+            return {"category": {"$eq": qf.category}}
+
+    if today_int is None:
+        today_int = int(datetime.now().strftime("%Y%m%d"))
+    conditions = []
 
     # 시간 기반 쿼리 처리 (오늘 이후 행사만)
-    if is_time_based_query(query):
-        today = datetime.now()
-        today_int = int(today.strftime("%Y%m%d"))
-
+    if qf.time_based:
         # 사용자가 명시한 연도/월이 과거인지 확인
         is_past_date = False
-        if year and month:
-            query_date_int = int(f"{year}{month:02d}28")
+        if qf.year and qf.month:
+            query_date_int = int(f"{qf.year}{qf.month:02d}28")
             is_past_date = query_date_int < today_int
-        elif year and month_range:
+        elif qf.year and qf.month_range:
             # 월 범위의 마지막 월 기준
-            last_month = max(month_range)
-            query_date_int = int(f"{year}{last_month:02d}28")
+            last_month = max(qf.month_range)
+            query_date_int = int(f"{qf.year}{last_month:02d}28")
             is_past_date = query_date_int < today_int
-        elif year:
-            is_past_date = year < today.year
+        elif qf.year:
+            is_past_date = qf.year < today_int // 10000
 
         # 과거 날짜가 아닌 경우에만 "오늘 이후" 필터 적용
         if not is_past_date:
             conditions.append({"start_date_int": {"$gte": today_int}})
 
     # 연도 필터
-    if year:
-        conditions.append({"year": {"$eq": year}})
+    if qf.year:
+        conditions.append({"year": {"$eq": qf.year}})
 
     # 월 필터 (단일 또는 범위)
-    if month_range:
-        conditions.append({"month": {"$in": month_range}})
-    elif month:
-        conditions.append({"month": {"$eq": month}})
+    if qf.month_range:
+        conditions.append({"month": {"$in": list(qf.month_range)}})
+    elif qf.month:
+        conditions.append({"month": {"$eq": qf.month}})
 
     # 주말/평일 필터
-    is_weekend = parse_weekend_filter(query)
-    if is_weekend is not None:
-        conditions.append({"is_weekend": {"$eq": is_weekend}})
+    if qf.is_weekend is not None:
+        conditions.append({"is_weekend": {"$eq": qf.is_weekend}})
 
     # 카테고리 필터
-    category = parse_category_from_query(query)
-    if category:
-        conditions.append({"category": {"$eq": category}})
+    if qf.category:
+        conditions.append({"category": {"$eq": qf.category}})
 
     # 제외 조건 ($ne)
-    exclusion = parse_exclusion_filter(query)
-    if exclusion:
-        conditions.append({"category": {"$ne": exclusion}})
+    if qf.exclusion:
+        conditions.append({"category": {"$ne": qf.exclusion}})
 
     # 등록 상태 필터
-    today_int = int(datetime.now().strftime("%Y%m%d"))
-    reg_status = parse_registration_filter(query)
-    if reg_status == "available":
+    if qf.reg_status == "available":
         # 오늘이 등록 기간 내 (시작일 <= 오늘 <= 마감일)
         conditions.append({"reg_start_int": {"$lte": today_int}})
         conditions.append({"reg_end_int": {"$gte": today_int}})
-    elif reg_status == "closing_soon":
+    elif qf.reg_status == "closing_soon":
         # 마감 7일 이내
-        week_later = int((datetime.now() + timedelta(days=7)).strftime("%Y%m%d"))
+        week_later = int(
+            date.fromordinal(_yyyymmdd_to_ordinal(today_int) + 7).strftime("%Y%m%d")
+        )
         conditions.append({"reg_end_int": {"$gte": today_int}})
         conditions.append({"reg_end_int": {"$lte": week_later}})
-    elif reg_status == "upcoming":
+    elif qf.reg_status == "upcoming":
         # 등록 시작 전
         conditions.append({"reg_start_int": {"$gt": today_int}})
-    elif reg_status == "exclude_closed":
+    elif qf.reg_status == "exclude_closed":
         # 마감 안 된 것만
         conditions.append({"reg_end_int": {"$gte": today_int}})
 
     # 행사 기간 필터
-    duration = parse_duration_filter(query)
-    if duration == "multi_day":
+    if qf.duration == "multi_day":
         conditions.append({"duration_days": {"$gt": 1}})
-    elif duration == "single_day":
+    elif qf.duration == "single_day":
         conditions.append({"duration_days": {"$eq": 1}})
 
-    # 참고: 장소 필터는 ChromaDB에서 $contains 미지원으로 Python 후처리에서 수행
+    # 장소 필터 (인덱싱 시 canonical 값으로 정규화된 location_normalized와 $eq 매칭)
+    if qf.location:
+        conditions.append({"location_normalized": {"$eq": qf.location}})
 
     if not conditions:
         return None
@@ -473,72 +633,49 @@ def build_chroma_filters(query: str) -> dict | None:
         return {"$and": conditions}
 
 
-def filter_nodes_by_location(nodes: list, location: str) -> list:
-    """Filter nodes by location (Python post-processing)."""
-    if not location:
-        return nodes
-
-    filtered = []
-    for node in nodes:
-        metadata = node.metadata if hasattr(node, 'metadata') else {}
-        node_location = metadata.get("location", "")
-        if location in node_location:
-            filtered.append(node)
-
-    return filtered
-
-
-def build_filter_description(query: str) -> str:
+def build_filter_description(qf: QueryFilters) -> str:
     """적용된 필터를 사람이 읽을 수 있는 형태로 설명."""
     descriptions = []
 
-    year, month, month_range = parse_date_from_query(query)
-    if year:
-        descriptions.append(f"{year}년")
-    if month:
-        descriptions.append(f"{month}월")
-    if month_range:
-        descriptions.append(f"{min(month_range)}월~{max(month_range)}월")
-
-    is_weekend = parse_weekend_filter(query)
-    if is_weekend is True:
+    if qf.year:
+        descriptions.append(f"{qf.year}년")
+    if qf.month:
+        descriptions.append(f"{qf.month}월")
+    if qf.month_range:
+        descriptions.append(f"{min(qf.month_range)}월~{max(qf.month_range)}월")
+
+    if qf.is_weekend is True:
         descriptions.append("주말(토/일) 행사")
-    elif is_weekend is False:
+    elif qf.is_weekend is False:
         descriptions.append("평일 행사")
 
-    category = parse_category_from_query(query)
-    if category:
-        descriptions.append(f"카테고리: {category}")
+    if qf.category:
+        descriptions.append(f"카테고리: {qf.category}")
 
-    exclusion = parse_exclusion_filter(query)
-    if exclusion:
-        descriptions.append(f"{exclusion} 제외")
+    if qf.exclusion:
+        descriptions.append(f"{qf.exclusion} 제외")
 
-    reg_status = parse_registration_filter(query)
-    if reg_status == "available":
+    if qf.reg_status == "available":
         descriptions.append("현재 등록 가능")
-    elif reg_status == "closing_soon":
+    elif qf.reg_status == "closing_soon":
         descriptions.append("등록 마감 임박")
-    elif reg_status == "upcoming":
+    elif qf.reg_status == "upcoming":
         descriptions.append("등록 시작 전")
 
-    duration = parse_duration_filter(query)
-    if duration == "multi_day":
+    if qf.duration == "multi_day":
         descriptions.append("며칠간 진행 행사")
-    elif duration == "single_day":
+    elif qf.duration == "single_day":
         descriptions.append("당일 행사")
 
-    location = parse_location_from_query(query)
-    if location:
-        descriptions.append(f"장소: {location}")
+    if qf.location:
+        descriptions.append(f"장소: {qf.location}")
 
-    credit_value, credit_org = parse_credits_from_query(query)
-    if credit_value is not None:
-        descriptions.append(f"평점: {credit_value}점")
-    if credit_org is not None:
-        descriptions.append(f"인정기관: {credit_org}")
+    if qf.credit_value is not None:
+        descriptions.append(f"평점: {qf.credit_value}점")
+    if qf.credit_org is not None:
+        descriptions.append(f"인정기관: {qf.credit_org}")
 
-    if is_time_based_query(query):
+    if qf.time_based:
         descriptions.append("오늘 이후 행사")
 
     if descriptions:
@@ -546,39 +683,61 @@ def build_filter_description(query: str) -> str:
     return ""
 
 
-def sort_nodes_by_date(nodes: list, ascending: bool = True) -> list:
-    """Sort nodes by start_date_int."""
-    def get_date_int(node):
-        metadata = node.metadata if hasattr(node, 'metadata') else {}
-        return metadata.get("start_date_int", 99999999)  # 날짜 없으면 맨 뒤로
+def _batch_from_nodes(nodes: list) -> RowBatch:
+    """유사도 검색 결과(NodeWithScore)를 RowBatch로 변환 (메타데이터 1회 추출)."""
+    return RowBatch.from_columns(
+        ids=[node.node_id for node in nodes],
+        texts=[node.text for node in nodes],
+        metadatas=[node.metadata for node in nodes],
+    )
 
-    return sorted(nodes, key=get_date_int, reverse=not ascending)
 
+def _yyyymmdd_to_ordinal(value: int) -> int:
+    """YYYYMMDD 정수를 날짜 ordinal로 변환 (정확한 일수 차 계산용)."""
+    return date(value // 10000, (value // 100) % 100, value % 100).toordinal()
 
-def calculate_registration_status(metadata: dict) -> str:
-    """등록 상태를 실시간 계산."""
-    today_int = int(datetime.now().strftime("%Y%m%d"))
-    reg_start = metadata.get("reg_start_int")
-    reg_end = metadata.get("reg_end_int")
-
-    if not reg_start or not reg_end:
-        return ""
-
-    if today_int < reg_start:
-        return "등록상태: 등록 시작 전"
-    elif today_int <= reg_end:
-        days_left = (reg_end % 100) - (today_int % 100)  # 간단한 일수 계산
-        if reg_end // 100 != today_int // 100:  # 월이 다르면 대략 계산
-            days_left = "며칠"
-        if isinstance(days_left, int) and days_left <= 7:
-            return f"등록상태: 등록 가능 (마감 {days_left}일 전)"
-        return "등록상태: 등록 가능"
-    else:
-        return "등록상태: 등록 마감"
 
+def _registration_statuses(batch: RowBatch, today_int: int | None = None) -> list[str]:
+    """배치의 등록 상태를 일괄 계산 (NumPy 벡터화).
+
+    오늘 날짜는 배치당 1회만 조회하고, 상태 분기는 SoA 정수 컬럼의
+    배열 비교로 계산한다. 마감까지 남은 일수는 ordinal 차이로 정확히
+    계산 (기존 '% 100' 근사치의 월 경계 버그 수정).
+    """
+    if today_int is None:
+        today_int = int(datetime.now().strftime("%Y%m%d"))
+    starts = batch.reg_starts
+    ends = batch.reg_ends
+
+    today_ord = _yyyymmdd_to_ordinal(today_int)
+
+    # 0: 등록정보 없음, 1: 시작 전, 2: 등록 가능, 3: 마감
+    codes = np.where(
+        (starts == 0) | (ends == 0),
+        0,
+        np.where(today_int < starts, 1, np.where(today_int <= ends, 2, 3)),
+    )
+
+    statuses = []
+    for code, end in zip(codes, ends):
+        if code == 0:
+            statuses.append("")
+        elif code == 1:
+            statuses.append("등록상태: 등록 시작 전")
+        elif code == 2:
+            days_left = _yyyymmdd_to_ordinal(int(end)) - today_ord
+            if days_left <= 7:
+                statuses.append(f"등록상태: 등록 가능 (마감 {days_left}일 전)")
+            else:
+                statuses.append("등록상태: 등록 가능")
+        else:
+            statuses.append("등록상태: 등록 마감")
+
+    return statuses
 
-def _handle_pagination_request(message: str) -> str:
-    """Handle request for more results from previous search."""
+
+def _handle_pagination_request(message: str) -> Generator[str, None, None]:
+    """Handle request for more results from previous search (토큰 단위 스트리밍)."""
     global _last_search_results, _last_search_offset, _last_search_query
 
     max_docs = config.RETRIEVAL_K
@@ -589,17 +748,19 @@ def _handle_pagination_request(message: str) -> str:
     end_idx = min(start_idx + max_docs, total_count)
 
     if start_idx >= total_count:
-        return f"더 이상 표시할 결과가 없습니다. (총 {total_count}개 모두 표시됨)"
+        yield f"더 이상 표시할 결과가 없습니다. (총 {total_count}개 모두 표시됨)"
+        return
 
-    # 다음 페이지 노드 가져오기
-    page_nodes = _last_search_results[start_idx:end_idx]
-    display_count = len(page_nodes)
+    # 다음 페이지 구간 가져오기
+    page_batch = _last_search_results.slice(start_idx, end_idx)
+    display_count = len(page_batch)
 
     # 오프셋 업데이트
     _last_search_offset = end_idx
 
-    # 컨텍스트 생성 (번호는 전체 기준으로)
-    context = format_nodes_as_context(page_nodes, start_number=start_idx + 1)
+    # 컨텍스트 생성 (번호는 전체 기준으로, 오늘 날짜는 요청당 1회 계산)
+    today_int = int(datetime.now().strftime("%Y%m%d"))
+    context = format_nodes_as_context(page_batch, start_number=start_idx + 1, today_int=today_int)
 
     llm = get_llm()
     remaining = total_count - end_idx
@@ -616,54 +777,57 @@ def _handle_pagination_request(message: str) -> str:
 
 답변:"""
 
-    response = llm.complete(prompt)
-    result = str(response)
+    for tok in llm.stream_complete(prompt):
+        yield tok.delta or ""
 
     if remaining > 0:
-        result += f"\n\n---\n📄 {remaining}개의 결과가 더 있습니다. '더 보여줘'로 확인하세요."
+        yield f"\n\n---\n📄 {remaining}개의 결과가 더 있습니다. '더 보여줘'로 확인하세요."
 
-    return result
 
+def format_nodes_as_context(
+    batch: RowBatch,
+    max_nodes: int | None = None,
+    start_number: int = 1,
+    today_int: int | None = None,
+) -> str:
+    """Format rows as concise context string for LLM.
 
-def format_nodes_as_context(nodes: list, max_nodes: int | None = None, start_number: int = 1) -> str:
-    """Format nodes as concise context string for LLM."""
+    SoA 컬럼을 위치 인덱스로 읽는다 - 행당 dict 해시 조회 제거.
+    """
     if max_nodes:
-        nodes = nodes[:max_nodes]
+        batch = batch.slice(0, max_nodes)
+
+    # 등록 상태 일괄 계산 (오늘 날짜 1회 조회 + 벡터화 비교)
+    reg_statuses = _registration_statuses(batch, today_int=today_int)
 
     context_parts = []
-    for i, node in enumerate(nodes, start_number):
-        metadata = node.metadata if hasattr(node, 'metadata') else {}
+    for i in range(len(batch)):
+        number = start_number + i
 
         # 간결한 포맷 사용
-        answer = metadata.get("answer_template", "")
-        url = metadata.get("url", "")
-
-        # 등록 상태 실시간 계산
-        reg_status = calculate_registration_status(metadata)
-
+        answer = batch.answers[i]
         if answer:
-            entry = f"{i}. {answer}"
-            if reg_status:
-                entry += f"\n   {reg_status}"
-            if url:
-                entry += f"\n   URL: {url}"
+            entry = f"{number}. {answer}"
+            if reg_statuses[i]:
+                entry += f"\n   {reg_statuses[i]}"
+            if batch.urls[i]:
+                entry += f"\n   URL: {batch.urls[i]}"
             context_parts.append(entry)
         else:
-            text = node.text if hasattr(node, 'text') else str(node)
-            context_parts.append(f"{i}. {text[:300]}")
+            context_parts.append(f"{number}. {batch.texts[i][:300]}")
 
     return "\n\n".join(context_parts)
 
 
-def chat(message: str) -> str:
+def chat(message: str) -> Generator[str, None, None]:
     """
-    Process a chat message and return the response.
+    Process a chat message and stream the response.
 
     Args:
         message: User message
 
-    Returns:
-        AI response string
+    Yields:
+        AI response text chunks (delta 단위 - 첫 토큰부터 즉시 표시)
     """
     global _last_search_results, _last_search_offset, _last_search_query
 
@@ -671,65 +835,79 @@ def chat(message: str) -> str:
 
     # 페이지네이션 요청 처리
     if is_pagination_request(message) and _last_search_results:
-        return _handle_pagination_request(message)
+        yield from _handle_pagination_request(message)
+        return
 
-    # 쿼리에서 필터 추출
-    chroma_filters = build_chroma_filters(message)
+    # 오늘 날짜는 요청당 1회만 계산해 전 구간에서 공유
+    now = datetime.now()
+    today_int = int(now.strftime("%Y%m%d"))
 
-    # 장소 필터 추출 (Python 후처리용)
-    location = parse_location_from_query(message)
+    # 쿼리를 한 번만 파싱해 전 구간에서 공유
+    qf = parse_query(message)
+    chroma_filters = build_chroma_filters(qf, today_int=today_int)
 
-    # 평점 필터 추출 (Python 후처리용)
-    credit_value, credit_org = parse_credits_from_query(message)
+    # 평점 필터 (Python 후처리용)
+    credit_value, credit_org = qf.credit_value, qf.credit_org
 
-    if chroma_filters or location or credit_value is not None or credit_org is not None:
+    if chroma_filters or credit_value is not None or credit_org is not None:
         if chroma_filters:
-            # 필터가 있으면 ChromaDB에서 모든 매칭 문서 직접 조회
-            nodes = get_all_by_filter(chroma_filters)
-            print(f"[검색] 필터 적용: {chroma_filters}, 결과: {len(nodes)}개 (전체)")
+            # 필터가 있으면 ChromaDB에서 모든 매칭 문서 직접 조회 (장소 포함)
+            # 시간 기반 쿼리는 ChromaDB 조회 단계에서 날짜순 정렬까지 수행
+            # answer_template로 컨텍스트를 만들므로 본문은 일단 생략 조회
+            batch = get_all_by_filter(
+                chroma_filters, sort_by_date=qf.time_based, include_documents=False
+            )
+            missing = [
+                i for i, answer in enumerate(batch.answers) if not answer
+            ]
+            if missing:
+                # answer_template 없는 행만 본문을 id 조회로 채움
+                # (전체 재조회 없이 해당 행의 텍스트 폴백 유지)
+                docs = get_documents_by_ids([batch.ids[i] for i in missing])
+                for i in missing:
+                    batch.texts[i] = docs.get(batch.ids[i], "")
+            print(f"[검색] 필터 적용: {chroma_filters}, 결과: {len(batch)}개 (전체)")
         else:
-            # 장소 필터만 있는 경우 전체 문서에서 필터링
-            nodes = get_all_by_filter(None)
-            print(f"[검색] 전체 문서 조회: {len(nodes)}개")
-
-        # 장소 필터 (Python 후처리 - ChromaDB는 $contains 미지원)
-        if location:
-            nodes = filter_nodes_by_location(nodes, location)
-            print(f"[필터] 장소 필터 적용: {location}, 결과: {len(nodes)}개")
+            # 평점 필터만 있는 경우: 전체 스캔 대신 유사도 상위 K개만 후처리
+            retriever = get_index().as_retriever(similarity_top_k=config.RETRIEVAL_K)
+            batch = _batch_from_nodes(retriever.retrieve(message))
+            print(f"[검색] 유사도 상위 {len(batch)}개 조회 (평점 후처리용)")
 
         # 평점 필터 (Python 후처리)
         if credit_value is not None or credit_org is not None:
-            nodes = filter_nodes_by_credits(nodes, credit_value, credit_org)
-            print(f"[필터] 평점 필터 적용: {credit_value}평점, {credit_org}, 결과: {len(nodes)}개")
-
-        if not nodes:
+            filtered = filter_batch_by_credits(batch, credit_value, credit_org)
+            if not chroma_filters and not len(filtered):
+                # 상위 K개에 매칭이 없을 때만 전체 조회로 폴백
+                batch = get_all_by_filter(None)
+                print(f"[검색] 전체 문서 조회 (폴백): {len(batch)}개")
+                filtered = filter_batch_by_credits(batch, credit_value, credit_org)
+            batch = filtered
+            print(f"[필터] 평점 필터 적용: {credit_value}평점, {credit_org}, 결과: {len(batch)}개")
+
+        if not len(batch):
             _last_search_results = []
             _last_search_offset = 0
             _last_search_query = ""
-            return "해당 조건에 맞는 문서를 찾을 수 없습니다."
-
-        # 시간 기반 쿼리면 날짜순 정렬
-        if is_time_based_query(message):
-            nodes = sort_nodes_by_date(nodes, ascending=True)
-            print(f"[정렬] 날짜순 정렬 완료")
+            yield "해당 조건에 맞는 문서를 찾을 수 없습니다."
+            return
 
         # 검색 결과 저장 (페이지네이션용)
-        _last_search_results = nodes
+        _last_search_results = batch
         _last_search_query = message
         _last_search_offset = config.RETRIEVAL_K  # 첫 페이지 이후부터 시작
 
         # 문서 수 제한 (LLM 속도 최적화)
         max_docs = config.RETRIEVAL_K  # 기본 20개
-        display_count = min(max_docs, len(nodes))
-        total_count = len(nodes)
-        context = format_nodes_as_context(nodes, max_nodes=max_docs)
+        display_count = min(max_docs, len(batch))
+        total_count = len(batch)
+        context = format_nodes_as_context(batch, max_nodes=max_docs, today_int=today_int)
         print(f"[LLM] {display_count}개 문서 전달 (총 {total_count}개)")
 
         # 적용된 필터 설명 생성
-        filter_desc = build_filter_description(message)
+        filter_desc = build_filter_description(qf)
 
         llm = get_llm()
-        system_prompt = get_system_prompt()
+        system_prompt = get_system_prompt(now)
         prompt = f"""{system_prompt}
 
 {filter_desc}
@@ -745,23 +923,23 @@ def chat(message: str) -> str:
 
 답변:"""
 
-        response = llm.complete(prompt)
-        result = str(response)
+        # 첫 토큰부터 즉시 표시 (전체 완료 대기 제거)
+        for tok in llm.stream_complete(prompt):
+            yield tok.delta or ""
 
         # 추가 결과 안내
         remaining = total_count - display_count
         if remaining > 0:
-            result += f"\n\n---\n📄 {remaining}개의 결과가 더 있습니다. '더 보여줘'로 확인하세요."
-
-        return result
+            yield f"\n\n---\n📄 {remaining}개의 결과가 더 있습니다. '더 보여줘'로 확인하세요."
 
     else:
-        # 필터가 없으면 유사도 검색 사용
+        # 필터가 없으면 유사도 검색 사용 (스트리밍 응답)
         index = get_index()
         query_engine = index.as_query_engine(
             similarity_top_k=config.RETRIEVAL_K,
-            text_qa_template=get_qa_prompt(),
-            system_prompt=get_system_prompt(),
+            text_qa_template=get_qa_prompt(now),
+            system_prompt=get_system_prompt(now),
+            streaming=True,
         )
 
         response = query_engine.query(message)
@@ -769,7 +947,10 @@ def chat(message: str) -> str:
         if hasattr(response, 'source_nodes'):
             print(f"[검색] 유사도 검색 결과: {len(response.source_nodes)}개")
 
-        return str(response)
+        if hasattr(response, 'response_gen'):
+            yield from response.response_gen
+        else:
+            yield str(response)
 
 
 def reset_chat_engine() -> None:
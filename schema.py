@@ -1,5 +1,6 @@
 """RAG document schema definitions using Pydantic."""
 
+import re
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -50,6 +51,48 @@ class RAGDocument(BaseModel):
     )
 
 
+# 장소 정규화 패턴 (인덱싱과 질의 파싱 양쪽에서 공유하는 canonical 값)
+# named group 하나의 교대 패턴으로 융합 - 장소 수만큼 재스캔하지 않고 1패스 매칭
+_LOCATION_RE = re.compile(
+    r"(?P<at_center>양재\s*aT\s*센터)"
+    r"|(?P<snu>서울대)"
+    r"|(?P<coex>코엑스)"
+    r"|(?P<bexco>벡스코)"
+    r"|(?P<sc_convention>SC\s*컨벤션)"
+    r"|(?P<st_mary>성모병원)"
+    r"|(?P<cau>중앙대)",
+    re.IGNORECASE,
+)
+_LOCATION_NAMES = {
+    "at_center": "양재 aT센터",
+    "snu": "서울대",
+    "coex": "코엑스",
+    "bexco": "벡스코",
+    "sc_convention": "SC 컨벤션센터",
+    "st_mary": "성모병원",
+    "cau": "중앙대",
+}
+
+
+def canonical_location(text: str) -> str | None:
+    """장소 문자열을 canonical 장소명으로 매핑 (매칭 없으면 None).
+
+    가장 왼쪽 매치가 아니라 그룹 선언 순서(우선순위)로 선택해
+    기존 패턴 리스트와 같은 결과를 유지한다.
+    """
+    if not text:
+        return None
+    best = None
+    best_rank = len(_LOCATION_RE.groupindex) + 1
+    for match in _LOCATION_RE.finditer(text):
+        rank = _LOCATION_RE.groupindex[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match.lastgroup, rank
+            if rank == 1:
+                break
+    return _LOCATION_NAMES[best] if best else None
+
+
 # Keyword synonyms mapping for common medical/academic terms
 KEYWORD_SYNONYMS: dict[str, list[str]] = {
     "COPD": ["만성폐쇄성폐질환", "만성 폐쇄성 폐질환", "chronic obstructive pulmonary disease"],
@@ -63,18 +106,29 @@ KEYWORD_SYNONYMS: dict[str, list[str]] = {
 }
 
 
-def get_synonyms(keyword: str) -> list[str]:
-    """Get synonyms for a keyword."""
-    synonyms = [keyword]
+def _build_synonym_index() -> dict[str, list[str]]:
+    """소문자 용어 → 동의어 그룹 역색인 (모듈 로드 시 1회 구축).
 
-    # Check if keyword is in synonyms map
-    keyword_lower = keyword.lower()
+    get_synonyms가 호출마다 전체 매핑을 선형 탐색하며 값 리스트를
+    소문자로 재구성하던 것을 dict 조회 1회로 대체.
+    """
+    index: dict[str, list[str]] = {}
     for key, values in KEYWORD_SYNONYMS.items():
-        if keyword_lower == key.lower() or keyword_lower in [v.lower() for v in values]:
-            synonyms.extend([key] + values)
-            break
+        group = [key] + values
+        for term in group:
+            index[term.lower()] = group
+    return index
+
+
+_SYNONYM_INDEX = _build_synonym_index()
 
-    return list(set(synonyms))
+
+def get_synonyms(keyword: str) -> list[str]:
+    """Get synonyms for a keyword."""
+    group = _SYNONYM_INDEX.get(keyword.lower())
+    if group is None:
+        return [keyword]
+    return list(dict.fromkeys([keyword] + group))
 
 
 def expand_keywords(keywords: list[str]) -> list[str]:
@@ -82,4 +136,4 @@ def expand_keywords(keywords: list[str]) -> list[str]:
     expanded = []
     for keyword in keywords:
         expanded.extend(get_synonyms(keyword))
-    return list(set(expanded))
+    return list(dict.fromkeys(expanded))
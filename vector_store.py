@@ -1,6 +1,9 @@
 """LlamaIndex VectorStoreIndex 관리 - ChromaDB 기반."""
 
+from dataclasses import dataclass
+
 import chromadb
+import numpy as np
 from llama_index.core import VectorStoreIndex, StorageContext
 from llama_index.core.schema import TextNode
 from llama_index.vector_stores.chroma import ChromaVectorStore
@@ -8,10 +11,90 @@ from llama_index.vector_stores.chroma import ChromaVectorStore
 import config
 from embeddings import get_embed_model
 
+
+@dataclass(slots=True)
+class RowBatch:
+    """필터 조회 결과의 SoA(Struct-of-Arrays) 컬럼 저장소.
+
+    행당 dict 7회 해시 조회 대신 컬럼을 위치 인덱스로 읽는다.
+    정수 컬럼(reg_*/start_dates)은 ndarray라 상태 계산/정렬이
+    벡터 연산으로 바로 이어진다. 값 없는 행은 0 (날짜 컬럼 기준).
+    """
+
+    ids: list[str]
+    texts: list[str]
+    answers: list[str]
+    urls: list[str]
+    credits: list[str]
+    reg_starts: np.ndarray
+    reg_ends: np.ndarray
+    start_dates: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_columns(cls, ids: list[str], texts: list[str], metadatas: list[dict]) -> "RowBatch":
+        """ChromaDB get() 결과를 1패스로 컬럼 분해."""
+        count = len(ids)
+        answers = []
+        urls = []
+        credits = []
+        reg_starts = np.zeros(count, dtype=np.int64)
+        reg_ends = np.zeros(count, dtype=np.int64)
+        start_dates = np.zeros(count, dtype=np.int64)
+
+        for i, metadata in enumerate(metadatas):
+            answers.append(metadata.get("answer_template", ""))
+            urls.append(metadata.get("url", ""))
+            credits.append(metadata.get("credits", ""))
+            reg_starts[i] = metadata.get("reg_start_int") or 0
+            reg_ends[i] = metadata.get("reg_end_int") or 0
+            start_dates[i] = metadata.get("start_date_int") or 0
+
+        return cls(
+            ids=ids,
+            texts=texts,
+            answers=answers,
+            urls=urls,
+            credits=credits,
+            reg_starts=reg_starts,
+            reg_ends=reg_ends,
+            start_dates=start_dates,
+        )
+
+    def take(self, indices) -> "RowBatch":
+        """위치 인덱스 배열로 부분 배치 생성 (필터/정렬 결과 적용용)."""
+        idx = np.asarray(indices, dtype=np.intp)
+        return RowBatch(
+            ids=[self.ids[i] for i in idx],
+            texts=[self.texts[i] for i in idx],
+            answers=[self.answers[i] for i in idx],
+            urls=[self.urls[i] for i in idx],
+            credits=[self.credits[i] for i in idx],
+            reg_starts=self.reg_starts[idx],
+            reg_ends=self.reg_ends[idx],
+            start_dates=self.start_dates[idx],
+        )
+
+    def slice(self, start: int, stop: int) -> "RowBatch":
+        """연속 구간 부분 배치 (페이지네이션용)."""
+        return RowBatch(
+            ids=self.ids[start:stop],
+            texts=self.texts[start:stop],
+            answers=self.answers[start:stop],
+            urls=self.urls[start:stop],
+            credits=self.credits[start:stop],
+            reg_starts=self.reg_starts[start:stop],
+            reg_ends=self.reg_ends[start:stop],
+            start_dates=self.start_dates[start:stop],
+        )
+
 # 싱글톤 인스턴스
 _vector_store: ChromaVectorStore | None = None
 _index: VectorStoreIndex | None = None
 _chroma_client: chromadb.ClientAPI | None = None
+_collection = None
 
 
 def get_chroma_client() -> chromadb.ClientAPI:
@@ -25,20 +108,37 @@ def get_chroma_client() -> chromadb.ClientAPI:
     return _chroma_client
 
 
+def _get_collection():
+    """Get the ChromaDB collection handle (singleton).
+
+    get_or_create_collection은 호출마다 메타데이터 조회를 동반하므로
+    프로세스 내에서 동일한 컬렉션 핸들을 재사용한다.
+    """
+    global _collection
+
+    if _collection is None:
+        _collection = get_chroma_client().get_or_create_collection("documents")
+
+    return _collection
+
+
 def get_vector_store() -> ChromaVectorStore:
     """Get ChromaDB vector store (singleton)."""
     global _vector_store
 
     if _vector_store is None:
         print("[초기화] ChromaDB 연결 중...")
-        client = get_chroma_client()
-        chroma_collection = client.get_or_create_collection("documents")
-        _vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
+        _vector_store = ChromaVectorStore(chroma_collection=_get_collection())
         print("[초기화] ChromaDB 연결 완료 (인메모리 모드)")
 
     return _vector_store
 
 
+def is_index_created() -> bool:
+    """VectorStoreIndex 생성 여부 (상태 표시용 - 생성을 유발하지 않음)."""
+    return _index is not None
+
+
 def get_index() -> VectorStoreIndex:
     """Get or create the VectorStoreIndex (singleton)."""
     global _index
@@ -60,52 +160,90 @@ def get_index() -> VectorStoreIndex:
 
 
 def add_documents(nodes: list[TextNode]) -> None:
-    """Add documents to the index."""
+    """Add documents to the index.
+
+    임베딩을 insert_nodes에 맡기지 않고 선계산한다 -
+    get_text_embedding_batch가 EMBED_BATCH_SIZE 단위로 모델을 호출하므로
+    (캐시 히트 시 sqlite 조회만) 노드당 개별 임베딩 호출이 사라진다.
+    """
     if not nodes:
         return
 
+    embed_model = get_embed_model()
+    embeddings = embed_model.get_text_embedding_batch(
+        [node.text for node in nodes], show_progress=False
+    )
+    for node, embedding in zip(nodes, embeddings):
+        node.embedding = embedding
+
     index = get_index()
     index.insert_nodes(nodes)
     print(f"[인덱싱] {len(nodes)}개 문서 추가 완료")
 
 
-def get_all_by_filter(filters: dict | None) -> list[TextNode]:
-    """Get ALL documents matching the filter (no similarity limit)."""
-    client = get_chroma_client()
-    collection = client.get_or_create_collection("documents")
+def count_documents() -> int:
+    """Get the number of documents currently in the collection."""
+    return _get_collection().count()
+
+
+def delete_by_source(source: str) -> None:
+    """특정 소스 파일에서 온 문서를 모두 삭제 (증분 재인덱싱용)."""
+    _get_collection().delete(where={"source": source})
+
+
+def get_all_by_filter(
+    filters: dict | None,
+    sort_by_date: bool = False,
+    include_documents: bool = True,
+) -> RowBatch:
+    """Get ALL documents matching the filter (no similarity limit).
+
+    Args:
+        filters: ChromaDB where 절 (None이면 전체 조회)
+        sort_by_date: start_date_int 오름차순 정렬 (NumPy C 정렬)
+        include_documents: False면 메타데이터만 조회 (answer_template로
+            컨텍스트를 만드는 경로에서 본문 직렬화/복사 생략)
+    """
+    collection = _get_collection()
+    include = ["documents", "metadatas"] if include_documents else ["metadatas"]
 
     # ChromaDB에서 필터에 맞는 모든 문서 조회
     # 빈 딕셔너리는 ChromaDB에서 오류 발생하므로 None으로 처리
     if filters:
-        results = collection.get(
-            where=filters,
-            include=["documents", "metadatas"],
-        )
+        results = collection.get(where=filters, include=include)
     else:
         # 필터 없이 전체 조회
-        results = collection.get(
-            include=["documents", "metadatas"],
-        )
+        results = collection.get(include=include)
+
+    ids = results["ids"] if results else []
+    if include_documents and results:
+        texts = results["documents"] or [""] * len(ids)
+    else:
+        texts = [""] * len(ids)
+    metadatas = (results["metadatas"] or [{}] * len(ids)) if results else []
+
+    # 메타데이터 dict 행 집합을 1패스로 컬럼 분해 (이후 단계는 위치 인덱스 접근)
+    batch = RowBatch.from_columns(list(ids), list(texts), list(metadatas))
+
+    if sort_by_date and len(batch):
+        # 값 없는 행(0)은 맨 뒤로
+        keys = np.where(batch.start_dates == 0, 99999999, batch.start_dates)
+        batch = batch.take(np.argsort(keys, kind="stable"))
 
-    nodes = []
-    if results and results["ids"]:
-        for i, doc_id in enumerate(results["ids"]):
-            text = results["documents"][i] if results["documents"] else ""
-            metadata = results["metadatas"][i] if results["metadatas"] else {}
+    return batch
 
-            node = TextNode(
-                text=text,
-                id_=doc_id,
-                metadata=metadata,
-            )
-            nodes.append(node)
 
-    return nodes
+def get_documents_by_ids(ids: list[str]) -> dict[str, str]:
+    """id 목록의 문서 본문만 조회 (answer_template 없는 행의 폴백용)."""
+    if not ids:
+        return {}
+    results = _get_collection().get(ids=ids, include=["documents"])
+    return dict(zip(results["ids"], results["documents"] or []))
 
 
 def clear_store() -> None:
     """Clear the vector store and reset index."""
-    global _vector_store, _index, _chroma_client
+    global _vector_store, _index, _chroma_client, _collection
 
     if _chroma_client is not None:
         try:
@@ -116,4 +254,5 @@ def clear_store() -> None:
 
     _vector_store = None
     _index = None
+    _collection = None
     print("[초기화] 벡터 스토어 초기화 완료")